@@ -748,8 +748,8 @@ async def extract_backtest_parameters(
         llm = _get_llm_for_strategy_generation()
         agent = create_parameter_extraction_agent(llm)
 
-        # Extract parameters using the agent
-        result = agent(
+        # Extract parameters using the agent without blocking the event loop on the LLM call
+        result = await agent.acall(
             user_message=request.user_message,
             conversation_history=request.conversation_history,
             current_form_state=request.current_form_state,
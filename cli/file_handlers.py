@@ -51,6 +51,37 @@ def save_report_section_decorator(message_buffer, report_dir):
     return wrapper
 
 
+def save_bulk_report_sections_decorator(message_buffer, report_dir):
+    """Decorator to save every report section touched by a bulk update to markdown files."""
+    original_bulk_update = message_buffer.bulk_update_report_sections
+
+    @wraps(original_bulk_update)
+    def wrapper(updates):
+        original_bulk_update(updates)
+        for section_name in updates:
+            content = message_buffer.report_sections.get(section_name)
+            if content:
+                with open(report_dir / f"{section_name}.md", "w") as f:
+                    f.write(content)
+
+    return wrapper
+
+
+def save_append_report_section_decorator(message_buffer, report_dir):
+    """Decorator to save a report section to its markdown file after a segment is appended."""
+    original_append_report_section = message_buffer.append_report_section
+
+    @wraps(original_append_report_section)
+    def wrapper(section_name, segment):
+        original_append_report_section(section_name, segment)
+        content = message_buffer.report_sections.get(section_name)
+        if content:
+            with open(report_dir / f"{section_name}.md", "w") as f:
+                f.write(content)
+
+    return wrapper
+
+
 def setup_file_handlers(message_buffer, results_dir: Path):
     """
     Setup file handlers for logging messages, tool calls, and reports.
@@ -73,5 +104,7 @@ def setup_file_handlers(message_buffer, results_dir: Path):
     message_buffer.add_message = save_message_decorator(message_buffer, log_file)
     message_buffer.add_tool_call = save_tool_call_decorator(message_buffer, log_file)
     message_buffer.update_report_section = save_report_section_decorator(message_buffer, report_dir)
+    message_buffer.bulk_update_report_sections = save_bulk_report_sections_decorator(message_buffer, report_dir)
+    message_buffer.append_report_section = save_append_report_section_decorator(message_buffer, report_dir)
 
     return log_file, report_dir
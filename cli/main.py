@@ -1,4 +1,7 @@
-from datetime import datetime
+import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 
 import typer
@@ -9,7 +12,6 @@ from rich.console import Console
 load_dotenv()
 
 from rich.align import Align
-from rich.live import Live
 from rich.panel import Panel
 
 from cli.asset_detection import detect_asset_class, get_asset_class_display_name
@@ -17,11 +19,8 @@ from cli.file_handlers import setup_file_handlers
 from cli.helpers import AnalystType
 from cli.message_buffer import MessageBuffer
 from cli.prompts import *
-from cli.report_display import display_complete_report
 from cli.stream_processor import process_chunk
-from cli.ui_display import create_layout, update_display
 from litadel.default_config import DEFAULT_CONFIG
-from litadel.graph.trading_graph import TradingAgentsGraph
 
 console = Console()
 
@@ -35,9 +34,27 @@ app = typer.Typer(
 # Create a global message buffer instance
 message_buffer = MessageBuffer()
 
+# Cheap shape check before handing analysis dates to the C date parser
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def prefetch_analysis_modules():
+    """Import the trading graph (LangGraph + LLM provider clients) in the background.
+
+    The model lists offered in Step 6 are static tables in cli.llm_config, so there is
+    nothing to fetch for them; the slow part of startup is this import. The questionnaire
+    is purely interactive, so the import can overlap with the user's typing and is
+    already loaded by the time the graph is built.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.submit(importlib.import_module, "litadel.graph.trading_graph")
+    executor.shutdown(wait=False)
+
 
 def get_user_selections():
     """Get all user selections before starting the analysis display."""
+    prefetch_analysis_modules()
+
     # Load config to check for pre-configured values
     # Display ASCII art welcome message
     with open("./cli/static/welcome.txt") as f:
@@ -177,10 +194,13 @@ def get_analysis_date():
     """Get the analysis date from user input."""
     while True:
         date_str = typer.prompt("", default=datetime.now().strftime("%Y-%m-%d"))
+        if not _DATE_RE.fullmatch(date_str):
+            console.print("[red]Error: Invalid date format. Please use YYYY-MM-DD[/red]")
+            continue
         try:
             # Validate date format and ensure it's not in the future
-            analysis_date = datetime.strptime(date_str, "%Y-%m-%d")
-            if analysis_date.date() > datetime.now().date():
+            analysis_date = date.fromisoformat(date_str)
+            if analysis_date > datetime.now().date():
                 console.print("[red]Error: Analysis date cannot be in the future[/red]")
                 continue
         except ValueError:
@@ -204,6 +224,9 @@ def setup_config(selections):
 
 def setup_analysis(selections, config):
     """Initialize the trading graph and file handlers."""
+    # Usually already imported by prefetch_analysis_modules()
+    from litadel.graph.trading_graph import TradingAgentsGraph
+
     # Initialize the graph
     graph = TradingAgentsGraph([analyst.value for analyst in selections["analysts"]], config=config, debug=True)
 
@@ -216,6 +239,8 @@ def setup_analysis(selections, config):
 
 def initialize_display(layout, selections):
     """Initialize the display with startup messages and agent statuses."""
+    from cli.ui_display import update_display
+
     # Initial display
     update_display(layout, message_buffer)
 
@@ -233,10 +258,7 @@ def initialize_display(layout, selections):
         message_buffer.update_agent_status(agent, "pending")
 
     # Reset report sections
-    for section in message_buffer.report_sections:
-        message_buffer.report_sections[section] = None
-    message_buffer.current_report = None
-    message_buffer.final_report = None
+    message_buffer.reset_report_sections()
 
     # Update agent status to in_progress for the first analyst
     first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
@@ -250,6 +272,8 @@ def initialize_display(layout, selections):
 
 def run_stream_analysis(graph, selections, layout):
     """Stream the analysis and process chunks in real-time."""
+    from cli.ui_display import update_display
+
     # Initialize state and get graph args
     init_agent_state = graph.propagator.create_initial_state(selections["ticker"], selections["analysis_date"])
     # CRITICAL: Add asset_class to state so market analyst can branch correctly
@@ -271,6 +295,9 @@ def run_stream_analysis(graph, selections, layout):
 
 def finalize_analysis(trace, graph, selections, layout):
     """Process final results and display the complete report."""
+    from cli.report_display import display_complete_report
+    from cli.ui_display import update_display
+
     # Get final state and decision
     final_state = trace[-1]
     graph.process_signal(final_state["final_trade_decision"])
@@ -281,10 +308,10 @@ def finalize_analysis(trace, graph, selections, layout):
 
     message_buffer.add_message("Analysis", f"Completed analysis for {selections['analysis_date']}")
 
-    # Update final report sections
-    for section in message_buffer.report_sections:
-        if section in final_state:
-            message_buffer.update_report_section(section, final_state[section])
+    # Update final report sections in one pass so the full report is rebuilt once
+    message_buffer.bulk_update_report_sections(
+        {section: final_state[section] for section in message_buffer.report_sections if section in final_state}
+    )
 
     # Display the complete final report
     display_complete_report(final_state)
@@ -294,6 +321,11 @@ def finalize_analysis(trace, graph, selections, layout):
 
 def run_analysis():
     """Main analysis orchestrator - coordinates the entire trading analysis workflow."""
+    # Rich layout/markdown rendering is only needed once an analysis actually runs
+    from rich.live import Live
+
+    from cli.ui_display import create_layout
+
     # Get user selections
     selections = get_user_selections()
 
@@ -1,7 +1,23 @@
 """Message buffer for tracking agent messages and reports in the CLI."""
 
 import datetime
-from collections import deque
+from collections import defaultdict, deque
+
+# Analyst report sections in display order, with their report headings
+_ANALYST_ORDER = (
+    ("macro_report", "Macroeconomic Context"),
+    ("market_report", "Market Analysis"),
+    ("sentiment_report", "Social Sentiment"),
+    ("news_report", "News Analysis"),
+    ("fundamentals_report", "Fundamentals Analysis"),
+)
+
+# Team decision sections that follow the analyst reports
+_TEAM_ORDER = (
+    ("investment_plan", "## Research Team Decision"),
+    ("trader_investment_plan", "## Trading Team Plan"),
+    ("final_trade_decision", "## Portfolio Management Decision"),
+)
 
 
 class MessageBuffer:
@@ -10,8 +26,8 @@ class MessageBuffer:
     def __init__(self, max_length=100):
         self.messages = deque(maxlen=max_length)
         self.tool_calls = deque(maxlen=max_length)
-        self.current_report = None
-        self.final_report = None  # Store the complete final report
+        self._current_report = None
+        self._final_report = None  # Store the complete final report
         # Initialize all agents as pending
         all_agents = [
             "Macro Analyst",
@@ -30,7 +46,7 @@ class MessageBuffer:
         ]
         self.agent_status = dict.fromkeys(all_agents, "pending")
         self.current_agent = None
-        self.report_sections = {
+        self._report_sections = {
             "macro_report": None,
             "market_report": None,
             "sentiment_report": None,
@@ -40,6 +56,29 @@ class MessageBuffer:
             "trader_investment_plan": None,
             "final_trade_decision": None,
         }
+        # Accumulated segments for sections built up incrementally via append_report_section
+        self._report_segments = defaultdict(list)
+        # Sections whose segments are not joined yet, and whether the current/final reports are outdated
+        self._dirty_sections = set()
+        self._reports_stale = False
+
+    @property
+    def report_sections(self):
+        """Report sections by name, joining any segments appended since the last read."""
+        for section_name in self._dirty_sections:
+            self._report_sections[section_name] = "".join(self._report_segments[section_name])
+        self._dirty_sections.clear()
+        return self._report_sections
+
+    @property
+    def current_report(self):
+        self._refresh_reports()
+        return self._current_report
+
+    @property
+    def final_report(self):
+        self._refresh_reports()
+        return self._final_report
 
     def add_message(self, message_type, content):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
@@ -55,8 +94,42 @@ class MessageBuffer:
             self.current_agent = agent
 
     def update_report_section(self, section_name, content):
-        if section_name in self.report_sections:
-            self.report_sections[section_name] = content
+        if section_name in self._report_sections:
+            self._set_report_section(section_name, content)
+            self._reports_stale = True
+
+    def bulk_update_report_sections(self, updates):
+        """Assign several report sections at once; the reports are rebuilt once, on the next read."""
+        for section_name, content in updates.items():
+            if section_name in self._report_sections:
+                self._set_report_section(section_name, content)
+                self._reports_stale = True
+
+    def append_report_section(self, section_name, segment):
+        """Append a segment to a report section; the section text is joined when it is next read."""
+        if section_name in self._report_sections:
+            self._report_segments[section_name].append(segment)
+            self._dirty_sections.add(section_name)
+            self._reports_stale = True
+
+    def reset_report_sections(self):
+        """Clear all report sections and the derived current/final reports."""
+        for section_name in self._report_sections:
+            self._report_sections[section_name] = None
+        self._report_segments.clear()
+        self._dirty_sections.clear()
+        self._reports_stale = False
+        self._current_report = None
+        self._final_report = None
+
+    def _set_report_section(self, section_name, content):
+        self._report_sections[section_name] = content
+        self._report_segments[section_name] = [content] if content else []
+        self._dirty_sections.discard(section_name)
+
+    def _refresh_reports(self):
+        if self._reports_stale:
+            self._reports_stale = False
             self._update_current_report()
 
     def _update_current_report(self):
@@ -82,50 +155,24 @@ class MessageBuffer:
                 "trader_investment_plan": "Trading Team Plan",
                 "final_trade_decision": "Portfolio Management Decision",
             }
-            self.current_report = f"### {section_titles[latest_section]}\n{latest_content}"
+            self._current_report = f"### {section_titles[latest_section]}\n{latest_content}"
 
         # Update the final complete report
         self._update_final_report()
 
     def _update_final_report(self):
+        sections = self.report_sections
         report_parts = []
 
         # Analyst Team Reports
-        if any(
-            self.report_sections[section]
-            for section in [
-                "macro_report",
-                "market_report",
-                "sentiment_report",
-                "news_report",
-                "fundamentals_report",
-            ]
-        ):
+        if any(sections[key] for key, _ in _ANALYST_ORDER):
             report_parts.append("## Analyst Team Reports")
-            if self.report_sections["macro_report"]:
-                report_parts.append(f"### Macroeconomic Context\n{self.report_sections['macro_report']}")
-            if self.report_sections["market_report"]:
-                report_parts.append(f"### Market Analysis\n{self.report_sections['market_report']}")
-            if self.report_sections["sentiment_report"]:
-                report_parts.append(f"### Social Sentiment\n{self.report_sections['sentiment_report']}")
-            if self.report_sections["news_report"]:
-                report_parts.append(f"### News Analysis\n{self.report_sections['news_report']}")
-            if self.report_sections["fundamentals_report"]:
-                report_parts.append(f"### Fundamentals Analysis\n{self.report_sections['fundamentals_report']}")
-
-        # Research Team Reports
-        if self.report_sections["investment_plan"]:
-            report_parts.append("## Research Team Decision")
-            report_parts.append(f"{self.report_sections['investment_plan']}")
-
-        # Trading Team Reports
-        if self.report_sections["trader_investment_plan"]:
-            report_parts.append("## Trading Team Plan")
-            report_parts.append(f"{self.report_sections['trader_investment_plan']}")
-
-        # Portfolio Management Decision
-        if self.report_sections["final_trade_decision"]:
-            report_parts.append("## Portfolio Management Decision")
-            report_parts.append(f"{self.report_sections['final_trade_decision']}")
-
-        self.final_report = "\n\n".join(report_parts) if report_parts else None
+            report_parts.extend(f"### {title}\n{sections[key]}" for key, title in _ANALYST_ORDER if sections[key])
+
+        # Research, Trading and Portfolio Management sections
+        for key, heading in _TEAM_ORDER:
+            if sections[key]:
+                report_parts.append(heading)
+                report_parts.append(sections[key])
+
+        self._final_report = "\n\n".join(report_parts) if report_parts else None
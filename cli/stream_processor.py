@@ -1,7 +1,32 @@
 """Stream processing logic for handling agent analysis chunks in the Litadel CLI."""
 
+from operator import attrgetter, itemgetter
+
 from cli.helpers import extract_content_string, update_research_team_status
 
+# Risk debate response key -> analyst, in debate order
+_RISK_ANALYSTS = {
+    "current_risky_response": "Risky Analyst",
+    "current_safe_response": "Safe Analyst",
+    "current_neutral_response": "Neutral Analyst",
+}
+
+# Sentinel for messages without a content attribute
+_MISSING = object()
+
+# (name, args) accessors for dict-style and object-style tool calls
+_TOOL_CALL_ITEMS = itemgetter("name", "args")
+_TOOL_CALL_ATTRS = attrgetter("name", "args")
+
+# Report key -> (analyst, next analyst type, next analyst), in pipeline order
+_REPORT_INFO = {
+    "macro_report": ("Macro Analyst", "market", "Market Analyst"),
+    "market_report": ("Market Analyst", "social", "Social Analyst"),
+    "sentiment_report": ("Social Analyst", "news", "News Analyst"),
+    "news_report": ("News Analyst", "fundamentals", "Fundamentals Analyst"),
+    "fundamentals_report": ("Fundamentals Analyst", None, None),
+}
+
 
 def process_message_chunk(chunk, message_buffer):
     """
@@ -18,54 +43,51 @@ def process_message_chunk(chunk, message_buffer):
     last_message = chunk["messages"][-1]
 
     # Extract message content and type
-    if hasattr(last_message, "content"):
-        content = extract_content_string(last_message.content)
-        msg_type = "Reasoning"
-    else:
+    content = getattr(last_message, "content", _MISSING)
+    if content is _MISSING:
         content = str(last_message)
         msg_type = "System"
+    else:
+        # Most messages carry plain str content; only list-style content needs the helper
+        if type(content) is not str:
+            content = extract_content_string(content)
+        msg_type = "Reasoning"
 
-    # Add message to buffer
-    message_buffer.add_message(msg_type, content)
+    # Add message to buffer, skipping empty content from tool-only messages
+    if content:
+        message_buffer.add_message(msg_type, content)
 
     # If it's a tool call, add it to tool calls
-    if hasattr(last_message, "tool_calls"):
-        for tool_call in last_message.tool_calls:
-            # Handle both dictionary and object tool calls
-            if isinstance(tool_call, dict):
-                message_buffer.add_tool_call(tool_call["name"], tool_call["args"])
-            else:
-                message_buffer.add_tool_call(tool_call.name, tool_call.args)
+    tool_calls = getattr(last_message, "tool_calls", ())
+    if tool_calls:
+        # Tool calls within one message are uniformly dicts or objects
+        get_name_args = _TOOL_CALL_ITEMS if isinstance(tool_calls[0], dict) else _TOOL_CALL_ATTRS
+        for tool_call in tool_calls:
+            message_buffer.add_tool_call(*get_name_args(tool_call))
 
 
-def process_analyst_reports(chunk, message_buffer, selected_analysts):
+def process_analyst_reports(chunk, message_buffer, selected_values):
     """
     Process analyst team reports from chunk.
 
     Args:
         chunk: The chunk dictionary from the graph stream
         message_buffer: The MessageBuffer instance to update
-        selected_analysts: List of selected analyst types
+        selected_values: Frozenset of selected analyst type values
     """
-    # Mapping of report keys to analyst info
-    analyst_mappings = [
-        ("macro_report", "Macro Analyst", "market", "Market Analyst"),
-        ("market_report", "Market Analyst", "social", "Social Analyst"),
-        ("sentiment_report", "Social Analyst", "news", "News Analyst"),
-        ("news_report", "News Analyst", "fundamentals", "Fundamentals Analyst"),
-        ("fundamentals_report", "Fundamentals Analyst", None, None),
-    ]
-
-    for report_key, analyst_name, next_type, next_analyst in analyst_mappings:
-        if chunk.get(report_key):
-            message_buffer.update_report_section(report_key, chunk[report_key])
-            message_buffer.update_agent_status(analyst_name, "completed")
-
-            if report_key == "fundamentals_report":
-                # Special case: set all research team to in_progress
-                update_research_team_status(message_buffer, "in_progress")
-            elif next_type and next_type in [a.value for a in selected_analysts]:
-                message_buffer.update_agent_status(next_analyst, "in_progress")
+    # Walk in pipeline order so a later analyst's status is never overwritten by an earlier report
+    for report_key, (analyst_name, next_type, next_analyst) in _REPORT_INFO.items():
+        report = chunk.get(report_key)
+        if not report:
+            continue
+        message_buffer.update_report_section(report_key, report)
+        message_buffer.update_agent_status(analyst_name, "completed")
+
+        if next_type is None:
+            # Last analyst (fundamentals): set all research team to in_progress
+            update_research_team_status(message_buffer, "in_progress")
+        elif next_type in selected_values:
+            message_buffer.update_agent_status(next_analyst, "in_progress")
 
 
 def process_research_debate(chunk, message_buffer):
@@ -80,16 +102,23 @@ def process_research_debate(chunk, message_buffer):
         return
 
     debate_state = chunk["investment_debate_state"]
+    get = debate_state.get
+    add_message = message_buffer.add_message
+    bull_history = get("bull_history")
+    bear_history = get("bear_history")
+    judge_decision = get("judge_decision")
+
+    # Keep all research team members in progress once the debate has started (the initial state is a
+    # truthy dict with empty histories) until the final decision, which marks them completed below
+    if (bull_history or bear_history) and not judge_decision:
+        update_research_team_status(message_buffer, "in_progress")
 
     # Update Bull Researcher status and report
-    if debate_state.get("bull_history"):
-        # Keep all research team members in progress
-        update_research_team_status(message_buffer, "in_progress")
+    if bull_history:
         # Extract latest bull response
-        bull_responses = debate_state["bull_history"].split("\n")
-        latest_bull = bull_responses[-1] if bull_responses else ""
+        latest_bull = bull_history.rpartition("\n")[2]
         if latest_bull:
-            message_buffer.add_message("Reasoning", latest_bull)
+            add_message("Reasoning", latest_bull)
             # Update research report with bull's latest analysis
             message_buffer.update_report_section(
                 "investment_plan",
@@ -97,32 +126,24 @@ def process_research_debate(chunk, message_buffer):
             )
 
     # Update Bear Researcher status and report
-    if debate_state.get("bear_history"):
-        # Keep all research team members in progress
-        update_research_team_status(message_buffer, "in_progress")
+    if bear_history:
         # Extract latest bear response
-        bear_responses = debate_state["bear_history"].split("\n")
-        latest_bear = bear_responses[-1] if bear_responses else ""
+        latest_bear = bear_history.rpartition("\n")[2]
         if latest_bear:
-            message_buffer.add_message("Reasoning", latest_bear)
+            add_message("Reasoning", latest_bear)
             # Update research report with bear's latest analysis
-            message_buffer.update_report_section(
+            message_buffer.append_report_section(
                 "investment_plan",
-                f"{message_buffer.report_sections['investment_plan']}\n\n### Bear Researcher Analysis\n{latest_bear}",
+                f"\n\n### Bear Researcher Analysis\n{latest_bear}",
             )
 
     # Update Research Manager status and final decision
-    if debate_state.get("judge_decision"):
-        # Keep all research team members in progress until final decision
-        update_research_team_status(message_buffer, "in_progress")
-        message_buffer.add_message(
-            "Reasoning",
-            f"Research Manager: {debate_state['judge_decision']}",
-        )
+    if judge_decision:
+        add_message("Reasoning", f"Research Manager: {judge_decision}")
         # Update research report with final decision
-        message_buffer.update_report_section(
+        message_buffer.append_report_section(
             "investment_plan",
-            f"{message_buffer.report_sections['investment_plan']}\n\n### Research Manager Decision\n{debate_state['judge_decision']}",
+            f"\n\n### Research Manager Decision\n{judge_decision}",
         )
         # Mark all research team members as completed
         update_research_team_status(message_buffer, "completed")
@@ -156,43 +177,50 @@ def process_risk_debate(chunk, message_buffer):
         return
 
     risk_state = chunk["risk_debate_state"]
-
-    # Handle all risk analysts with a mapping
-    risk_analysts = [
-        ("current_risky_response", "Risky Analyst"),
-        ("current_safe_response", "Safe Analyst"),
-        ("current_neutral_response", "Neutral Analyst"),
-    ]
-
-    for response_key, analyst_name in risk_analysts:
-        if risk_state.get(response_key):
-            message_buffer.update_agent_status(analyst_name, "in_progress")
-            message_buffer.add_message(
-                "Reasoning",
-                f"{analyst_name}: {risk_state[response_key]}",
-            )
-            message_buffer.update_report_section(
-                "final_trade_decision",
-                f"### {analyst_name} Analysis\n{risk_state[response_key]}",
-            )
+    get = risk_state.get
+    add_message = message_buffer.add_message
+    update_status = message_buffer.update_agent_status
+    update_report = message_buffer.update_report_section
+
+    sections = []
+    for response_key, analyst_name in _RISK_ANALYSTS.items():
+        text = get(response_key)
+        if not text:
+            continue
+        update_status(analyst_name, "in_progress")
+        add_message("Reasoning", f"{analyst_name}: {text}")
+        sections.append(f"### {analyst_name} Analysis\n{text}")
+
+    # Write all risk analyst sections in one update
+    if sections:
+        update_report("final_trade_decision", "\n\n".join(sections))
 
     # Update Portfolio Manager status and final decision
-    if risk_state.get("judge_decision"):
-        message_buffer.update_agent_status("Portfolio Manager", "in_progress")
-        message_buffer.add_message(
-            "Reasoning",
-            f"Portfolio Manager: {risk_state['judge_decision']}",
-        )
-        # Update risk report with final decision only
-        message_buffer.update_report_section(
-            "final_trade_decision",
-            f"### Portfolio Manager Decision\n{risk_state['judge_decision']}",
-        )
+    judge_decision = get("judge_decision")
+    if judge_decision:
+        update_status("Portfolio Manager", "in_progress")
+        add_message("Reasoning", f"Portfolio Manager: {judge_decision}")
+        # Append the final decision after the risk analyst sections
+        decision = f"### Portfolio Manager Decision\n{judge_decision}"
+        if sections:
+            message_buffer.append_report_section("final_trade_decision", f"\n\n{decision}")
+        else:
+            update_report("final_trade_decision", decision)
         # Mark risk analysts as completed
-        message_buffer.update_agent_status("Risky Analyst", "completed")
-        message_buffer.update_agent_status("Safe Analyst", "completed")
-        message_buffer.update_agent_status("Neutral Analyst", "completed")
-        message_buffer.update_agent_status("Portfolio Manager", "completed")
+        for analyst_name in _RISK_ANALYSTS.values():
+            update_status(analyst_name, "completed")
+        update_status("Portfolio Manager", "completed")
+
+
+# Top-level state keys and the processor that handles each, in pipeline order
+_DISPATCH = (
+    ("investment_debate_state", process_research_debate),
+    ("trader_investment_plan", process_trader_report),
+    ("risk_debate_state", process_risk_debate),
+)
+
+# State keys carrying analyst team reports
+_REPORT_KEYS = frozenset(_REPORT_INFO)
 
 
 def process_chunk(chunk, message_buffer, selected_analysts):
@@ -214,10 +242,12 @@ def process_chunk(chunk, message_buffer, selected_analysts):
     # Process messages and tool calls
     process_message_chunk(chunk, message_buffer)
 
-    # Process different report types
-    process_analyst_reports(chunk, message_buffer, selected_analysts)
-    process_research_debate(chunk, message_buffer)
-    process_trader_report(chunk, message_buffer)
-    process_risk_debate(chunk, message_buffer)
+    # Process only the report types present in this chunk
+    if not _REPORT_KEYS.isdisjoint(chunk):
+        selected_values = frozenset(a.value for a in selected_analysts)
+        process_analyst_reports(chunk, message_buffer, selected_values)
+    for key, processor in _DISPATCH:
+        if chunk.get(key):
+            processor(chunk, message_buffer)
 
     return True
@@ -8,77 +8,84 @@ from litadel.agents.utils.agent_utils import (
     get_income_statement,
 )
 
+_EQUITY_FUND_SYSTEM_MESSAGE = (
+    "You are a researcher tasked with analyzing fundamental information over the past week about a company. "
+    "Please write a comprehensive report of the company's fundamental information such as financial documents, "
+    "company profile, basic company financials, and company financial history to gain a full view of the company's "
+    "fundamental information to inform traders. Make sure to include as much detail as possible. "
+    "Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
+    "\n\n**IMPORTANT: Analyze analyst earnings estimates** using `get_earnings_estimates(ticker)` to understand market expectations "
+    "and identify potential beat/miss scenarios. Compare historical earnings surprises to gauge the company's track record of "
+    "meeting or exceeding expectations. This forward-looking analysis is critical for trading decisions."
+    "\n\n**CRITICAL FOR BACKTESTING**: When calling `get_balance_sheet`, `get_cashflow`, or `get_income_statement`, "
+    "you MUST pass curr_date='{current_date}' to ensure you only see financial data available on or before that date. "
+    "This prevents look-ahead bias."
+    "\n\nMake sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
+    " Use the available tools: `get_fundamentals(ticker, curr_date)` for comprehensive company analysis, "
+    "`get_balance_sheet(ticker, freq='quarterly', curr_date='{current_date}')`, "
+    "`get_cashflow(ticker, freq='quarterly', curr_date='{current_date}')`, "
+    "`get_income_statement(ticker, freq='quarterly', curr_date='{current_date}')` for specific financial statements, "
+    "and `get_earnings_estimates(ticker)` for analyst expectations and consensus."
+)
+
+_NONEQUITY_FUND_SYSTEM_MESSAGE = (
+    "Fundamental analysis is not applicable for {asset_class} assets. "
+    "This analyst will skip analysis for non-equity assets."
+)
+
+_FUND_SYSTEM_MESSAGES = {"equity": _EQUITY_FUND_SYSTEM_MESSAGE}
+
 
 def create_fundamentals_analyst(llm):
+    equity_tools = [
+        get_fundamentals,
+        get_balance_sheet,
+        get_cashflow,
+        get_income_statement,
+        get_earnings_estimates,
+    ]
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a helpful AI assistant, collaborating with other assistants."
+                " Use the provided tools to progress towards answering the question."
+                " If you are unable to fully answer, that's OK; another assistant with different tools"
+                " will help where you left off. Execute what you can to make progress."
+                " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+                " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+                " You have access to the following tools: {tool_names}.\n{system_message}"
+                "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
+            ),
+            MessagesPlaceholder(variable_name="messages"),
+        ]
+    )
+
+    # The tool set only depends on the asset class, so bind each variant once
+    equity_prompt = prompt.partial(tool_names=", ".join(tool.name for tool in equity_tools))
+    equity_chain = equity_prompt | llm.bind_tools(equity_tools)
+    non_equity_chain = prompt.partial(tool_names="") | llm.bind_tools([])
+
     def fundamentals_analyst_node(state):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
-        state["company_of_interest"]
         asset_class = state.get("asset_class", "equity")
 
-        # Only use earnings estimates for equity (stocks)
-        if asset_class == "equity":
-            tools = [
-                get_fundamentals,
-                get_balance_sheet,
-                get_cashflow,
-                get_income_statement,
-                get_earnings_estimates,
-            ]
-
-            system_message = (
-                "You are a researcher tasked with analyzing fundamental information over the past week about a company. "
-                "Please write a comprehensive report of the company's fundamental information such as financial documents, "
-                "company profile, basic company financials, and company financial history to gain a full view of the company's "
-                "fundamental information to inform traders. Make sure to include as much detail as possible. "
-                "Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
-                "\n\n**IMPORTANT: Analyze analyst earnings estimates** using `get_earnings_estimates(ticker)` to understand market expectations "
-                "and identify potential beat/miss scenarios. Compare historical earnings surprises to gauge the company's track record of "
-                "meeting or exceeding expectations. This forward-looking analysis is critical for trading decisions."
-                "\n\n**CRITICAL FOR BACKTESTING**: When calling `get_balance_sheet`, `get_cashflow`, or `get_income_statement`, "
-                f"you MUST pass curr_date='{current_date}' to ensure you only see financial data available on or before that date. "
-                "This prevents look-ahead bias."
-                "\n\nMake sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."
-                " Use the available tools: `get_fundamentals(ticker, curr_date)` for comprehensive company analysis, "
-                "`get_balance_sheet(ticker, freq='quarterly', curr_date='{current_date}')`, "
-                "`get_cashflow(ticker, freq='quarterly', curr_date='{current_date}')`, "
-                "`get_income_statement(ticker, freq='quarterly', curr_date='{current_date}')` for specific financial statements, "
-                "and `get_earnings_estimates(ticker)` for analyst expectations and consensus.",
-            )
-        else:
-            # For commodities and crypto, fundamentals analyst doesn't make sense
-            # Skip this analyst or provide minimal analysis
-            tools = []
-            system_message = (
-                f"Fundamental analysis is not applicable for {asset_class} assets. "
-                "This analyst will skip analysis for non-equity assets."
-            )
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
+        # Only use earnings estimates for equity (stocks); fundamentals don't apply to commodities and crypto
+        chain = equity_chain if asset_class == "equity" else non_equity_chain
+        system_message = _FUND_SYSTEM_MESSAGES.get(asset_class, _NONEQUITY_FUND_SYSTEM_MESSAGE).format(
+            current_date=current_date, asset_class=asset_class
         )
 
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
-
-        chain = prompt | llm.bind_tools(tools)
-
-        result = chain.invoke(state["messages"])
+        result = chain.invoke(
+            {
+                "messages": state["messages"],
+                "system_message": system_message,
+                "current_date": current_date,
+                "ticker": ticker,
+            }
+        )
 
         report = ""
 
@@ -7,14 +7,35 @@ from litadel.agents.utils.agent_utils import (
 
 
 def create_social_media_analyst(llm):
+    # Use unified tools for all asset classes
+    tools = [get_asset_news, get_global_news]
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a helpful AI assistant, collaborating with other assistants."
+                " Use the provided tools to progress towards answering the question."
+                " If you are unable to fully answer, that's OK; another assistant with different tools"
+                " will help where you left off. Execute what you can to make progress."
+                " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+                " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+                " You have access to the following tools: {tool_names}.\n{system_message}"
+                "For your reference, the current date is {current_date}. The current company we want to analyze is {ticker}",
+            ),
+            MessagesPlaceholder(variable_name="messages"),
+        ]
+    )
+
+    # The prompt and tool set do not depend on the state, so build and bind them once
+    prompt = prompt.partial(tool_names=", ".join(tool.name for tool in tools))
+    chain = prompt | llm.bind_tools(tools)
+
     def social_media_analyst_node(state):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
         asset_class = state.get("asset_class", "equity")
 
-        # Use unified tools for all asset classes
-        tools = [get_asset_news, get_global_news]
-
         # Asset-specific messaging
         if asset_class == "commodity":
             system_message = (
@@ -50,32 +71,15 @@ def create_social_media_analyst(llm):
                 f"""\n\n**CRITICAL BACKTESTING RULE**: The current date is {current_date}. When calling get_asset_news, the end_date parameter MUST NOT exceed {current_date}. Only request data published on or before {current_date} to avoid look-ahead bias."""
             )
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The current company we want to analyze is {ticker}",
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
+        result = chain.invoke(
+            {
+                "messages": state["messages"],
+                "system_message": system_message,
+                "current_date": current_date,
+                "ticker": ticker,
+            }
         )
 
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
-
-        chain = prompt | llm.bind_tools(tools)
-
-        result = chain.invoke(state["messages"])
-
         report = ""
 
         if len(result.tool_calls) == 0:
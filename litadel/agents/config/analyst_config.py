@@ -1,111 +1,174 @@
 """Centralized configuration for analyst tools and prompts based on asset class."""
 
-from langchain_core.tools import BaseTool
+import importlib
+import sys
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Annotation only; keeps langchain_core.tools out of prompt-only imports
+    from langchain_core.tools import BaseTool
+
+# Supported asset classes. AnalystConfig normalizes to one of these interned values
+# (anything else falls back to equity), so later checks can compare by identity.
+_EQUITY = sys.intern("equity")
+_COMMODITY = sys.intern("commodity")
+
+_NEWS_TOOLS = "litadel.agents.utils.news_data_tools"
+_FUNDAMENTAL_TOOLS = "litadel.agents.utils.fundamental_data_tools"
+
+# (module, attribute) of each tool per (asset class, analyst type). Tools are imported
+# on first use so only the vendor modules an analyst actually needs get loaded.
+_TOOL_SPECS = {
+    ("equity", "market"): (
+        ("litadel.agents.utils.core_stock_tools", "get_stock_data"),
+        ("litadel.agents.utils.unified_market_tools", "get_indicators"),
+    ),
+    ("equity", "news"): (
+        (_NEWS_TOOLS, "get_news"),
+        (_NEWS_TOOLS, "get_global_news"),
+        (_NEWS_TOOLS, "get_insider_sentiment"),
+        (_NEWS_TOOLS, "get_insider_transactions"),
+    ),
+    ("equity", "social"): (
+        (_NEWS_TOOLS, "get_news"),
+        (_NEWS_TOOLS, "get_global_news"),
+    ),
+    ("equity", "fundamentals"): (
+        (_FUNDAMENTAL_TOOLS, "get_fundamentals"),
+        (_FUNDAMENTAL_TOOLS, "get_balance_sheet"),
+        (_FUNDAMENTAL_TOOLS, "get_cashflow"),
+        (_FUNDAMENTAL_TOOLS, "get_income_statement"),
+    ),
+    ("commodity", "market"): (("litadel.agents.utils.commodity_data_tools", "get_commodity_data"),),
+    ("commodity", "news"): (
+        (_NEWS_TOOLS, "get_commodity_news"),
+        (_NEWS_TOOLS, "get_global_news"),
+    ),
+    ("commodity", "social"): (
+        (_NEWS_TOOLS, "get_commodity_news"),
+        (_NEWS_TOOLS, "get_global_news"),
+    ),
+    ("commodity", "fundamentals"): (),  # Not applicable for commodities
+}
+
+# Resolved tools per (asset class, analyst type), filled on first lookup
+_TOOLS_TABLE: dict[tuple[str, str], tuple["BaseTool", ...]] = {}
+
+
+def _load_tools(asset_class: str, analyst_type: str) -> tuple["BaseTool", ...]:
+    """Import the tools for an asset class / analyst type pair and store them in _TOOLS_TABLE."""
+    specs = _TOOL_SPECS.get((asset_class, analyst_type))
+    if specs is None:
+        # Only look up the equity fallback on a miss
+        specs = _TOOL_SPECS.get((_EQUITY, analyst_type), ())
+    tools = tuple(getattr(importlib.import_module(module), name) for module, name in specs)
+    _TOOLS_TABLE[asset_class, analyst_type] = tools
+    return tools
+
+
+_COMMODITY_PROMPT_CFG = {
+    "asset_term": "commodity",
+    "asset_name_var": "ticker",  # Still use ticker variable name for compatibility
+    "market": {
+        "focus": "supply/demand factors, geopolitical events, weather impacts (for agriculture), and macroeconomic trends",
+        "data_tool": "get_commodity_data",
+        "instructions": "call get_commodity_data to retrieve commodity price data",
+    },
+    "news": {
+        "focus": "supply/demand factors, geopolitical events, weather impacts (for agriculture), and macroeconomic trends",
+        "primary_tool": "get_commodity_news(commodity, start_date, end_date)",
+        "primary_note": "searches by topic like 'energy' for oil, 'economy_macro' for agriculture",
+        "fallback_note": "If get_commodity_news returns limited results, make sure to use get_global_news to provide additional market context.",
+    },
+    "social": {
+        "focus": "trader sentiment, supply/demand expectations, geopolitical concerns, and market psychology",
+        "primary_tool": "get_commodity_news(commodity, start_date, end_date)",
+        "primary_note": "searches by topic like 'energy' for oil",
+        "fallback_note": "If get_commodity_news returns limited results, supplement with get_global_news(curr_date, look_back_days, limit) for broader market context.",
+    },
+}
+
+_EQUITY_PROMPT_CFG = {
+    "asset_term": "company",
+    "asset_name_var": "ticker",
+    "market": {
+        "focus": "price trends, volume, volatility, and technical indicators",
+        "data_tool": "get_stock_data and get_indicators",
+        "instructions": "call get_stock_data first to retrieve historical price data, then get_indicators for technical analysis",
+    },
+    "news": {
+        "focus": "company-specific events, earnings, product launches, and market sentiment",
+        "primary_tool": "get_news(ticker, start_date, end_date)",
+        "primary_note": "for company-specific or targeted news searches",
+        "fallback_note": "Use get_global_news(curr_date, look_back_days, limit) for broader macroeconomic context.",
+    },
+    "social": {
+        "focus": "social media discussions, public sentiment, and community perception",
+        "primary_tool": "get_news(ticker, start_date, end_date)",
+        "primary_note": "to search for company-specific news and social media discussions",
+        "fallback_note": "If needed, use get_global_news(curr_date, look_back_days, limit) for broader market context.",
+    },
+}
+
+_ANALYST_PROMPT_TYPES = ("market", "news", "social")
+
+
+@lru_cache(maxsize=8)
+def _prompt_config(asset_class: str) -> Mapping[str, Any]:
+    """Build the per-analyst prompt configs for an asset class once.
+
+    Each analyst entry carries the shared terminology keys (asset_term, asset_name_var)
+    alongside its own settings, which is the shape the prompt builders read.
+    """
+    cfg = _COMMODITY_PROMPT_CFG if asset_class is _COMMODITY else _EQUITY_PROMPT_CFG
+    shared = {"asset_term": cfg["asset_term"], "asset_name_var": cfg["asset_name_var"]}
+    # Read-only all the way down so the cached configs can be shared between concurrent analysts
+    return MappingProxyType(
+        {analyst: MappingProxyType({**shared, **cfg[analyst]}) for analyst in _ANALYST_PROMPT_TYPES}
+    )
 
 
 class AnalystConfig:
     """Configuration for analysts based on asset class."""
 
+    __slots__ = ("_asset_class",)
+
     def __init__(self, asset_class: str = "equity"):
-        self.asset_class = asset_class.lower()
+        # Asset classes without their own configuration use the equity setup
+        self._asset_class = _COMMODITY if asset_class.lower() == _COMMODITY else _EQUITY
 
-    def get_tools_for_analyst(self, analyst_type: str) -> list[BaseTool]:
+    @property
+    def asset_class(self) -> str:
+        """Normalized asset class ("equity" or "commodity"); read-only so cached instances can be shared."""
+        return self._asset_class
+
+    def get_tools_for_analyst(self, analyst_type: str) -> Sequence["BaseTool"]:
         """Get the appropriate tools for a given analyst based on asset class.
 
         Args:
             analyst_type: One of 'market', 'news', 'social', 'fundamentals'
 
         Returns:
-            List of tools for that analyst
+            Shared, immutable tuple of tools for that analyst; copy it before modifying
         """
-        # Import here to avoid circular dependencies
-        from litadel.agents.utils.agent_utils import (
-            get_balance_sheet,
-            get_cashflow,
-            get_commodity_news,
-            get_fundamentals,
-            get_global_news,
-            get_income_statement,
-            get_indicators,
-            get_insider_sentiment,
-            get_insider_transactions,
-            get_news,
-            get_stock_data,
-        )
-        from litadel.agents.utils.commodity_data_tools import get_commodity_data
-
-        tools_map = {
-            "equity": {
-                "market": [get_stock_data, get_indicators],
-                "news": [get_news, get_global_news, get_insider_sentiment, get_insider_transactions],
-                "social": [get_news, get_global_news],
-                "fundamentals": [get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement],
-            },
-            "commodity": {
-                "market": [get_commodity_data],
-                "news": [get_commodity_news, get_global_news],
-                "social": [get_commodity_news, get_global_news],
-                "fundamentals": [],  # Not applicable for commodities
-            },
-        }
-
-        return tools_map.get(self.asset_class, tools_map["equity"]).get(analyst_type, [])
-
-    def get_prompt_config(self, _analyst_type: str) -> dict[str, str]:
+        tools = _TOOLS_TABLE.get((self.asset_class, analyst_type))
+        if tools is None:
+            tools = _load_tools(self.asset_class, analyst_type)
+        return tools
+
+    def get_prompt_config(self, analyst_type: str) -> Mapping[str, str]:
         """Get prompt configuration for a given analyst based on asset class.
 
-        Returns a dict with prompt templates and asset-specific terminology.
+        Returns the analyst's prompt settings together with the asset-specific
+        terminology as a read-only mapping shared between calls.
         """
-        if self.asset_class == "commodity":
-            return {
-                "asset_term": "commodity",
-                "asset_name_var": "ticker",  # Still use ticker variable name for compatibility
-                "market": {
-                    "focus": "supply/demand factors, geopolitical events, weather impacts (for agriculture), and macroeconomic trends",
-                    "data_tool": "get_commodity_data",
-                    "instructions": "call get_commodity_data to retrieve commodity price data",
-                },
-                "news": {
-                    "focus": "supply/demand factors, geopolitical events, weather impacts (for agriculture), and macroeconomic trends",
-                    "primary_tool": "get_commodity_news(commodity, start_date, end_date)",
-                    "primary_note": "searches by topic like 'energy' for oil, 'economy_macro' for agriculture",
-                    "fallback_note": "If get_commodity_news returns limited results, make sure to use get_global_news to provide additional market context.",
-                },
-                "social": {
-                    "focus": "trader sentiment, supply/demand expectations, geopolitical concerns, and market psychology",
-                    "primary_tool": "get_commodity_news(commodity, start_date, end_date)",
-                    "primary_note": "searches by topic like 'energy' for oil",
-                    "fallback_note": "If get_commodity_news returns limited results, supplement with get_global_news(curr_date, look_back_days, limit) for broader market context.",
-                },
-            }
-        # equity
-        return {
-            "asset_term": "company",
-            "asset_name_var": "ticker",
-            "market": {
-                "focus": "price trends, volume, volatility, and technical indicators",
-                "data_tool": "get_stock_data and get_indicators",
-                "instructions": "call get_stock_data first to retrieve historical price data, then get_indicators for technical analysis",
-            },
-            "news": {
-                "focus": "company-specific events, earnings, product launches, and market sentiment",
-                "primary_tool": "get_news(ticker, start_date, end_date)",
-                "primary_note": "for company-specific or targeted news searches",
-                "fallback_note": "Use get_global_news(curr_date, look_back_days, limit) for broader macroeconomic context.",
-            },
-            "social": {
-                "focus": "social media discussions, public sentiment, and community perception",
-                "primary_tool": "get_news(ticker, start_date, end_date)",
-                "primary_note": "to search for company-specific news and social media discussions",
-                "fallback_note": "If needed, use get_global_news(curr_date, look_back_days, limit) for broader market context.",
-            },
-        }
-
-
-# Singleton instance can be created per graph
-_config_instance = None
+        return _prompt_config(self.asset_class)[analyst_type]
 
 
+@lru_cache(maxsize=4)
 def get_analyst_config(asset_class: str = "equity") -> AnalystConfig:
-    """Get or create analyst configuration for the given asset class."""
+    """Get the shared analyst configuration for the given asset class."""
     return AnalystConfig(asset_class)
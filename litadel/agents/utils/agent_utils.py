@@ -1,41 +1,95 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from langchain_core.messages import HumanMessage, RemoveMessage
 
-from litadel.agents.utils.alpha_intelligence_tools import (
-    get_earnings_estimates,
-    get_market_movers,
-)
-
-# Import tools from separate utility files
-from litadel.agents.utils.core_stock_tools import get_stock_data
-from litadel.agents.utils.crypto_data_tools import get_crypto_data
-from litadel.agents.utils.economic_indicator_tools import get_economic_indicators
-
-# Note: get_indicators is imported from unified_market_tools (see below)
-# The old technical_indicators_tools version is deprecated
-from litadel.agents.utils.fundamental_data_tools import (
-    get_balance_sheet,
-    get_cashflow,
-    get_fundamentals,
-    get_income_statement,
-)
-from litadel.agents.utils.news_data_tools import (
-    get_commodity_news,
-    get_crypto_news,
-    get_global_news,
-    get_insider_sentiment,
-    get_insider_transactions,
-    get_news,
-)
-
-# Unified tools provide a consistent interface across asset classes
-from litadel.agents.utils.unified_market_tools import (
-    get_asset_news,
-    get_indicators,  # Uses new unified signature with adapter for old vendor implementations
-    get_market_data,
-)
-from litadel.agents.utils.unified_market_tools import (
-    get_global_news as get_global_news_unified,
-)
+if TYPE_CHECKING:
+    from litadel.agents.utils.alpha_intelligence_tools import get_earnings_estimates, get_market_movers
+    from litadel.agents.utils.core_stock_tools import get_stock_data
+    from litadel.agents.utils.crypto_data_tools import get_crypto_data
+    from litadel.agents.utils.economic_indicator_tools import get_economic_indicators
+    from litadel.agents.utils.fundamental_data_tools import (
+        get_balance_sheet,
+        get_cashflow,
+        get_fundamentals,
+        get_income_statement,
+    )
+    from litadel.agents.utils.news_data_tools import (
+        get_commodity_news,
+        get_crypto_news,
+        get_global_news,
+        get_insider_sentiment,
+        get_insider_transactions,
+        get_news,
+    )
+    from litadel.agents.utils.unified_market_tools import get_asset_news, get_indicators, get_market_data
+    from litadel.agents.utils.unified_market_tools import get_global_news as get_global_news_unified
+
+# Tool name -> (module, attribute). Tools are imported on first access so that
+# importing this module (e.g. only for create_msg_delete) does not load every tool.
+# Note: get_indicators comes from unified_market_tools; the old
+# technical_indicators_tools version is deprecated.
+_LAZY = {
+    "get_earnings_estimates": ("litadel.agents.utils.alpha_intelligence_tools", "get_earnings_estimates"),
+    "get_market_movers": ("litadel.agents.utils.alpha_intelligence_tools", "get_market_movers"),
+    "get_stock_data": ("litadel.agents.utils.core_stock_tools", "get_stock_data"),
+    "get_crypto_data": ("litadel.agents.utils.crypto_data_tools", "get_crypto_data"),
+    "get_economic_indicators": ("litadel.agents.utils.economic_indicator_tools", "get_economic_indicators"),
+    "get_balance_sheet": ("litadel.agents.utils.fundamental_data_tools", "get_balance_sheet"),
+    "get_cashflow": ("litadel.agents.utils.fundamental_data_tools", "get_cashflow"),
+    "get_fundamentals": ("litadel.agents.utils.fundamental_data_tools", "get_fundamentals"),
+    "get_income_statement": ("litadel.agents.utils.fundamental_data_tools", "get_income_statement"),
+    "get_commodity_news": ("litadel.agents.utils.news_data_tools", "get_commodity_news"),
+    "get_crypto_news": ("litadel.agents.utils.news_data_tools", "get_crypto_news"),
+    "get_global_news": ("litadel.agents.utils.news_data_tools", "get_global_news"),
+    "get_insider_sentiment": ("litadel.agents.utils.news_data_tools", "get_insider_sentiment"),
+    "get_insider_transactions": ("litadel.agents.utils.news_data_tools", "get_insider_transactions"),
+    "get_news": ("litadel.agents.utils.news_data_tools", "get_news"),
+    # Unified tools provide a consistent interface across asset classes
+    "get_asset_news": ("litadel.agents.utils.unified_market_tools", "get_asset_news"),
+    "get_indicators": ("litadel.agents.utils.unified_market_tools", "get_indicators"),
+    "get_market_data": ("litadel.agents.utils.unified_market_tools", "get_market_data"),
+    "get_global_news_unified": ("litadel.agents.utils.unified_market_tools", "get_global_news"),
+}
+
+__all__ = [
+    "create_msg_delete",
+    "get_asset_news",
+    "get_balance_sheet",
+    "get_cashflow",
+    "get_commodity_news",
+    "get_crypto_data",
+    "get_crypto_news",
+    "get_earnings_estimates",
+    "get_economic_indicators",
+    "get_fundamentals",
+    "get_global_news",
+    "get_global_news_unified",
+    "get_income_statement",
+    "get_indicators",
+    "get_insider_sentiment",
+    "get_insider_transactions",
+    "get_market_data",
+    "get_market_movers",
+    "get_news",
+    "get_stock_data",
+]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
 
 
 def create_msg_delete():
@@ -44,11 +98,11 @@ def create_msg_delete():
         messages = state["messages"]
 
         # Remove all messages
-        removal_operations = [RemoveMessage(id=m.id) for m in messages]
+        operations = [RemoveMessage(id=m.id) for m in messages]
 
-        # Add a minimal placeholder message
-        placeholder = HumanMessage(content="Continue")
+        # Add a minimal placeholder message in place, avoiding a second list
+        operations.append(HumanMessage(content="Continue"))
 
-        return {"messages": [*removal_operations, placeholder]}
+        return {"messages": operations}
 
     return delete_messages
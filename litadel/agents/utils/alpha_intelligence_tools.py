@@ -1,17 +1,45 @@
 """Alpha Intelligence™ tools for earnings estimates and market movers."""
 
-from langchain_core.tools import tool
+import importlib
+import time
+from collections.abc import Callable
+from functools import lru_cache
+
+from pydantic import BaseModel, Field
+
+from litadel.agents.utils.tool_helpers import lazy_tools, safe_call
+
+# Data functions resolved on first use, so the Alpha Vantage client is only loaded when a tool runs
+_cache: dict[str, Callable] = {}
+
+
+def _impl(name: str) -> Callable:
+    func = _cache.get(name)
+    if func is None:
+        module = importlib.import_module("litadel.dataflows.alpha_vantage_intelligence")
+        func = _cache[name] = getattr(module, name)
+    return func
+
+
+def _call(name: str, *args) -> str:
+    return _impl(name)(*args)
 
-from litadel.dataflows.alpha_vantage_intelligence import (
-    get_earnings_estimates as get_earnings_estimates_impl,
-)
-from litadel.dataflows.alpha_vantage_intelligence import (
-    get_market_movers as get_market_movers_impl,
-)
 
+@lru_cache(maxsize=1)
+def _market_movers_for_minute(_minute: int) -> str:
+    # Movers only change intraday, so reuse one API response per wall-clock minute
+    return _call("get_market_movers")
 
-@tool
-def get_earnings_estimates(ticker: str) -> str:
+
+class _EarningsEstimatesArgs(BaseModel):
+    ticker: str = Field(description='Stock ticker symbol (e.g., "AAPL", "TSLA", "NVDA")')
+
+
+class _MarketMoversArgs(BaseModel):
+    """get_market_movers takes no arguments."""
+
+
+def _get_earnings_estimates(ticker: str) -> str:
     """
     Retrieve analyst earnings estimates and consensus for a stock ticker.
 
@@ -35,14 +63,10 @@ def get_earnings_estimates(ticker: str) -> str:
         >>> estimates = get_earnings_estimates("AAPL")
         >>> # Returns quarterly earnings, estimates, surprises, beat rate
     """
-    try:
-        return get_earnings_estimates_impl(ticker)
-    except Exception as e:
-        return f"Error retrieving earnings estimates for {ticker}: {e!s}"
+    return safe_call(f"earnings estimates for {ticker}", _call, "get_earnings_estimates", ticker)
 
 
-@tool
-def get_market_movers() -> str:
+def _get_market_movers() -> str:
     """
     Retrieve today's top gaining and losing stocks in the market.
 
@@ -61,7 +85,14 @@ def get_market_movers() -> str:
         >>> movers = get_market_movers()
         >>> # Returns tables of top gainers and losers with current stats
     """
-    try:
-        return get_market_movers_impl()
-    except Exception as e:
-        return f"Error retrieving market movers: {e!s}"
+    return safe_call("market movers", _market_movers_for_minute, int(time.time() // 60))
+
+
+# Tool objects are built on first access (e.g. when an analyst's tool list is resolved)
+__getattr__ = lazy_tools(
+    globals(),
+    {
+        "get_earnings_estimates": (_get_earnings_estimates, _EarningsEstimatesArgs),
+        "get_market_movers": (_get_market_movers, _MarketMoversArgs),
+    },
+)
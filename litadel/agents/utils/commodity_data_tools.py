@@ -1,19 +1,28 @@
-from typing import Annotated
+from pydantic import BaseModel, Field
 
-from langchain_core.tools import tool
+from litadel.agents.utils.tool_helpers import lazy_tools
+from litadel.dataflows.interface import get_single_vendor_impl, route_to_vendor
 
-from litadel.dataflows.interface import route_to_vendor
+# Commodity data has a single vendor, so resolve its implementation once instead of routing each call
+_commodity_data_impl = get_single_vendor_impl("get_commodity_data")
 
 
-@tool
-def get_commodity_data(
-    commodity: Annotated[str, "name like WTI, BRENT, NATURAL_GAS, COPPER"],
-    start_date: Annotated[str, "YYYY-mm-dd"],
-    end_date: Annotated[str, "YYYY-mm-dd"],
-    interval: Annotated[str, "daily|weekly|monthly"] = "monthly",
-) -> str:
+class CommodityDataArgs(BaseModel):
+    commodity: str = Field(description="name like WTI, BRENT, NATURAL_GAS, COPPER")
+    start_date: str = Field(description="YYYY-mm-dd")
+    end_date: str = Field(description="YYYY-mm-dd")
+    interval: str = Field(default="monthly", description="daily|weekly|monthly")
+
+
+def _get_commodity_data(commodity: str, start_date: str, end_date: str, interval: str = "monthly") -> str:
     """
     Retrieve commodity price data for a given commodity symbol.
     Uses the configured commodity_data vendor.
     """
+    if _commodity_data_impl is not None:
+        return _commodity_data_impl(commodity, start_date, end_date, interval)
     return route_to_vendor("get_commodity_data", commodity, start_date, end_date, interval)
+
+
+# The tool object is built on first access (e.g. when the market analyst resolves its tools)
+__getattr__ = lazy_tools(globals(), {"get_commodity_data": (_get_commodity_data, CommodityDataArgs)})
@@ -1,12 +1,48 @@
 """Economic indicator tools for macro analysis."""
 
-from langchain_core.tools import tool
+import contextlib
+from collections import OrderedDict
 
+from pydantic import BaseModel, Field
+
+from litadel.agents.utils.tool_helpers import lazy_tools, safe_call
 from litadel.dataflows.alpha_vantage_economic import get_all_economic_indicators
 
+# Reports are filtered by date, so every analyst and ticker on the same trade date shares one fetch
+_INDICATOR_CACHE: OrderedDict[str, str] = OrderedDict()
+_INDICATOR_CACHE_MAXSIZE = 512
+# Markers of an indicator section that failed to load; reports containing one are fetched again next time
+_INDICATOR_ERROR_MARKERS = ("Error parsing ", "data structure unexpected")
+
+
+def _cached_economic_indicators(current_date: str) -> str:
+    report = _INDICATOR_CACHE.get(current_date)
+    if report is not None:
+        # Another analyst thread may have evicted the entry since the get()
+        with contextlib.suppress(KeyError):
+            _INDICATOR_CACHE.move_to_end(current_date)
+        return report
+
+    report = get_all_economic_indicators(max_date=current_date)
+    if not any(marker in report for marker in _INDICATOR_ERROR_MARKERS):
+        _INDICATOR_CACHE[current_date] = report
+        if len(_INDICATOR_CACHE) > _INDICATOR_CACHE_MAXSIZE:
+            _INDICATOR_CACHE.popitem(last=False)
+    return report
+
+
+def clear_economic_indicator_cache() -> None:
+    """Drop cached economic indicator reports, e.g. when switching from backtesting to live analysis."""
+    _INDICATOR_CACHE.clear()
 
-@tool
-def get_economic_indicators(current_date: str) -> str:
+
+class _EconomicIndicatorsArgs(BaseModel):
+    current_date: str = Field(
+        description="Current date in YYYY-MM-DD format. Only indicators published on or before this date will be included."
+    )
+
+
+def _get_economic_indicators(current_date: str) -> str:
     """
     Retrieve key macroeconomic indicators including GDP, CPI, unemployment,
     federal funds rate, treasury yields, and retail sales.
@@ -28,7 +64,8 @@ def get_economic_indicators(current_date: str) -> str:
         >>> indicators = get_economic_indicators("2024-10-24")
         >>> # Returns GDP growth, inflation, unemployment, etc. available as of 2024-10-24
     """
-    try:
-        return get_all_economic_indicators(max_date=current_date)
-    except Exception as e:
-        return f"Error retrieving economic indicators: {e!s}"
+    return safe_call("economic indicators", _cached_economic_indicators, current_date)
+
+
+# The tool object is built on first access (e.g. when the macro analyst is created)
+__getattr__ = lazy_tools(globals(), {"get_economic_indicators": (_get_economic_indicators, _EconomicIndicatorsArgs)})
@@ -5,38 +5,173 @@ detects user intent (backtest, live trading, analysis), and generates
 clarification questions for missing required fields.
 """
 
+import asyncio
+import contextlib
+import copy
+import hashlib
 import json
 import logging
+import re
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 from langchain_core.prompts import ChatPromptTemplate
 
+from litadel.agents.utils.prompt_caching import cacheable_system_message
+
+try:
+    # orjson is optional; its decode error subclasses json.JSONDecodeError, so error handling is unchanged
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Extraction results for previously seen requests, shared across agent instances
+# (the API creates a new agent per request). Least recently used entries are evicted.
+_RESULT_CACHE: OrderedDict[str, dict] = OrderedDict()
+_RESULT_CACHE_MAXSIZE = 2048
 
-def create_parameter_extraction_agent(llm):
-    """
-    Create a parameter extraction agent.
 
-    Args:
-        llm: The language model to use for extraction
+def _cache_result(cache_key: str, result_dict: dict) -> None:
+    """Store a copy of an extraction result, evicting the least recently used entry when full."""
+    _RESULT_CACHE[cache_key] = copy.deepcopy(result_dict)
+    if len(_RESULT_CACHE) > _RESULT_CACHE_MAXSIZE:
+        _RESULT_CACHE.popitem(last=False)
 
-    Returns:
-        A callable agent that extracts parameters from natural language
+
+def clear_parameter_extraction_cache() -> None:
+    """Drop cached extraction results, e.g. after changing the model configuration or post-processing rules."""
+    _RESULT_CACHE.clear()
+
+
+def _result_cache_key(model_id: str, today_str: str, user_message: str, conversation_context: str) -> str:
+    """Hash everything the LLM response depends on, with the message case- and whitespace-normalized."""
+    normalized_message = " ".join(user_message.lower().split())
+    payload = "\0".join((model_id, today_str, normalized_message, conversation_context))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _term_trie_regex(terms) -> str:
+    """Build a regex for any of the terms with shared prefixes factored out (e.g. "stonk(?:s)?").
+
+    Matching a trie-shaped pattern only follows branches that fit the text seen so far, so it behaves
+    like an Aho-Corasick scan instead of retrying every term at every position.
     """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}  # A term ends here
 
-    # Calculate date context
-    today = datetime.now()
-    current_year = today.year
-    ytd_start = f"{current_year}-01-01"
-    last_year_start = f"{current_year - 1}-01-01"
-    last_year_end = f"{current_year - 1}-12-31"
-    two_years_ago = f"{current_year - 2}-01-01"
-    six_months_ago = (today - timedelta(days=180)).strftime("%Y-%m-%d")
-    today_str = today.strftime("%Y-%m-%d")
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Terms ending here make the rest optional; callers only test whether some term occurs
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _any_term_pattern(terms: tuple[str, ...]) -> re.Pattern:
+    """Compile a pattern matching any of the terms as a plain substring (same semantics as ``term in text``)."""
+    return re.compile(_term_trie_regex(terms))
 
-    # System prompt with properly escaped JSON examples
-    system_prompt = f"""You are a parameter extraction agent for a trading platform. Today's date is {today_str}.
+
+@lru_cache(maxsize=1024)
+def _parse_iso(date_str: str) -> datetime | None:
+    """Parse a YYYY-MM-DD date to a naive datetime at midnight, or None if it isn't a valid date.
+
+    The same few dates recur across a conversation, so results (including failures) are cached.
+    Uses the ``%Y-%m-%d`` format the prompt asks for, which also accepts unpadded months and days
+    (e.g. 2023-1-5).
+    """
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d")  # noqa: DTZ007
+    except (ValueError, TypeError):
+        return None
+
+
+# Keyword heuristics, applied to lowercased text
+# Strategy styles that are too vague for a technical strategy on their own
+_VAGUE_RX = _any_term_pattern(("momentum", "value", "growth", "trend", "swing"))
+# Indicators and comparisons that make a technical strategy concrete
+_SPECIFICS_RX = _any_term_pattern(
+    (
+        *("rsi", "macd", "ema", "sma", "bollinger", "stochastic", "%", "threshold"),
+        *("cross", "above", "below", ">=", "<=", "<", ">"),
+    )
+)
+# Asset preference answers that hand the choice to the AI
+_AI_MANAGED_RX = _any_term_pattern(
+    (
+        "you choose",
+        "ai-managed",
+        "ai managed",
+        "doesn't matter",
+        "don't care",
+        "up to you",
+        "surprise me",
+        "you",
+        "no preference",
+        "no",
+    )
+)
+# Asset preferences that are only slang and need clarification
+_SLANG_TERMS = frozenset(("stonk", "stonks", "stock", "stocks"))
+# Markers showing a strategy description was already flagged as AI-managed (case-sensitive)
+_AI_MANAGED_DESC_RX = _any_term_pattern(("AI will select", "AI-managed"))
+# What a strategy description mentions, as bit flags collected in one scan
+_FLAG_CLEAR_PREF = 1  # Clear asset class preference
+_FLAG_TICKER = 2  # Specific ticker
+_FLAG_SLANG = 4  # Slang like "stonks"
+_DESC_FLAG_TERMS = {
+    # Clear preferences come first so "ethereum" is not consumed as the "eth" ticker
+    "clear_pref": (
+        _FLAG_CLEAR_PREF,
+        (
+            "tech stock",
+            "technology stock",
+            "crypto",
+            "cryptocurrency",
+            "blue chip",
+            "small cap",
+            "large cap",
+            "etf",
+            "s&p 500",
+            "nasdaq",
+            "bitcoin",
+            "ethereum",
+        ),
+    ),
+    "ticker": (_FLAG_TICKER, ("aapl", "msft", "tsla", "googl", "amzn", "btc", "eth", "spy", "qqq")),
+    "slang": (_FLAG_SLANG, ("stonk", "stonks")),
+}
+_DESC_FLAGS_RX = re.compile(
+    "|".join(f"(?P<{group}>{_any_term_pattern(terms).pattern})" for group, (_, terms) in _DESC_FLAG_TERMS.items())
+)
+_DESC_FLAG_BITS = {group: bit for group, (bit, _) in _DESC_FLAG_TERMS.items()}
+_ALL_DESC_FLAGS = _FLAG_CLEAR_PREF | _FLAG_TICKER | _FLAG_SLANG
+
+
+def _description_flags(desc_lower: str) -> int:
+    """Collect the _FLAG_* bits for the terms mentioned in a lowercased description in a single pass."""
+    flags = 0
+    for match in _DESC_FLAGS_RX.finditer(desc_lower):
+        flags |= _DESC_FLAG_BITS[match.lastgroup]
+        if flags == _ALL_DESC_FLAGS:
+            break
+    return flags
+
+
+# Extraction instructions that do not depend on the current date. Kept as a module constant so the
+# text sent to the LLM is identical on every call (a prerequisite for provider-side prompt caching).
+_STATIC_SYSTEM_PROMPT = """You are a parameter extraction agent for a trading platform. Today's date is given under **Date Reference** at the end.
 
 Your task is to extract trading parameters from natural language. DO NOT assume strategy type unless explicitly stated.
 
@@ -127,10 +262,7 @@ For ANALYSIS intent:
    - 50000 → 50000
 
 3. Date parsing (ONLY if user explicitly mentions - otherwise mark as missing!):
-   - "last 2 years" → {two_years_ago} to {today_str}
-   - "last year" → {last_year_start} to {last_year_end}
-   - "YTD" / "this year" → {ytd_start} to {today_str}
-   - "last 6 months" → {six_months_ago} to {today_str}
+   - "last 2 years", "last year", "YTD" / "this year", "last 6 months" → use the ranges under **Date Reference** at the end
    - Specific months: "Jan 2023" → "2023-01-01"
    - Year only: "2023" → "2023-01-01" to "2023-12-31"
    - **NEVER auto-fill dates if user doesn't mention them!**
@@ -168,55 +300,55 @@ Generate specific questions for missing required fields:
   * "Which timeframe? (daily, hourly, 15min for intraday)"
 
 **Output Format (JSON only, no markdown):**
-{{{{
+{
   "intent": "backtest",
-  "extracted": {{{{
+  "extracted": {
     "strategy_description": "RSI mean reversion strategy for TSLA",
     "capital": 50000,
     "start_date": "2022-01-01",
     "end_date": "2023-12-31",
     "ticker_list": ["TSLA"],
     "indicators": [
-      {{{{"name": "RSI", "period": 14}}}},
-      {{{{"name": "SMA", "period": 50}}}}
+      {"name": "RSI", "period": 14},
+      {"name": "SMA", "period": 50}
     ],
-    "entry_conditions": {{{{
+    "entry_conditions": {
       "rsi_below": 30,
       "price_above_sma": true
-    }}}},
-    "exit_conditions": {{{{
+    },
+    "exit_conditions": {
       "rsi_above": 70,
       "stop_loss_pct": 3.0,
       "take_profit_pct": 10.0
-    }}}},
-    "risk_params": {{{{
+    },
+    "risk_params": {
       "position_size_pct": 10,
       "max_position_size": 5000
-    }}}}
-  }}}},
+    }
+  },
   "missing": ["field1"],
-  "confidence": {{{{
+  "confidence": {
     "strategy_description": 0.9,
     "capital": 1.0,
     "start_date": 0.9,
     "indicators": 0.95,
     "entry_conditions": 0.8
-  }}}},
+  },
   "needs_clarification": false,
   "clarification_questions": [
-    {{{{
+    {
       "question": "What RSI threshold for entry? (common: 30 for oversold)",
       "field": "entry_conditions.rsi_below",
       "suggestions": [20, 30, 35],
       "field_type": "number"
-    }}}}
+    }
   ],
-  "suggested_defaults": {{{{
+  "suggested_defaults": {
     "rebalance_frequency": "weekly",
     "position_sizing": "equal_weight",
     "max_positions": 10
-  }}}}
-}}}}
+  }
+}
 
 **Important:**
 - Return ONLY valid JSON, no markdown code blocks
@@ -224,276 +356,685 @@ Generate specific questions for missing required fields:
 - Generate helpful clarification questions for missing fields
 - For backtest intent, start_date and end_date are required
 - For live_trading intent, dates are optional (ongoing)
-- For analysis intent, only strategy_description (or ticker) is needed
-- Use double curly braces {{{{}}}} in JSON examples to escape them"""
+- For analysis intent, only strategy_description (or ticker) is needed"""
+
+
+# Shared suggestion lists for clarification questions. Tuples, so every question can reference
+# the same object; nothing downstream modifies suggestions.
+_DATE_PRESETS = ("Last 2 Years", "Last Year", "YTD", "Custom")
+_RECENT_PERIODS = ("Last 6 Months", "Last Year", "Last 2 Years")
+_CAPITAL_SUGGESTIONS = (10000, 50000, 100000)
+_ASSET_SUGGESTIONS = ("Tech Stocks", "Crypto", "Blue Chips", "You Choose")
+_PREFERENCE_SUGGESTIONS = ("Aggressive growth", "Conservative value", "Tech & crypto", "Blue chip stocks")
+
+# Fallback clarification question per missing field, used when the LLM response can't be parsed
+_QUESTION_TEMPLATES = MappingProxyType(
+    {
+        "strategy_type": MappingProxyType(
+            {
+                "question": "What type of trading strategy would you like?",
+                "field": "strategy_type",
+                "suggestions": (
+                    "AI Managed (I set preferences, AI makes trades)",
+                    "Technical Strategy (I define specific rules)",
+                ),
+                "field_type": "select",
+            }
+        ),
+        "strategy_description": MappingProxyType(
+            {
+                "question": "Please describe your trading strategy (e.g., 'Momentum strategy for tech stocks' or 'Buy when RSI < 30, sell when RSI > 70')",
+                "field": "strategy_description",
+                "suggestions": (),
+                "field_type": "textarea",
+            }
+        ),
+        "capital": MappingProxyType(
+            {
+                "question": "What initial capital would you like to use?",
+                "field": "capital",
+                "suggestions": _CAPITAL_SUGGESTIONS,
+                "field_type": "number",
+            }
+        ),
+        "asset_preferences": MappingProxyType(
+            {
+                "question": "What would you like to trade? (e.g., 'AAPL, MSFT' or 'tech stocks' or 'crypto' or 'you choose')",
+                "field": "asset_preferences",
+                "suggestions": _ASSET_SUGGESTIONS,
+                "field_type": "select",
+            }
+        ),
+        "dates": MappingProxyType(
+            {
+                "question": "What time period for the backtest?",
+                "field": "dates",
+                "suggestions": _DATE_PRESETS,
+                "field_type": "select",
+            }
+        ),
+    }
+)
+# Missing fields that share the single "dates" question
+_DATE_FIELDS = frozenset(("start_date", "end_date", "dates"))
+
+# Messages that are only ticker symbols, e.g. "AAPL, MSFT" or "BTC-USD and ETH-USD"; these skip the LLM
+_TICKER_RX = re.compile(r"\b[A-Z]{1,5}(?:-USD)?\b")
+_TICKER_ONLY_RX = re.compile(r"[A-Z]{1,5}(?:-USD)?(?:(?:\s*[,&/]\s*|\s+and\s+|\s+)[A-Z]{1,5}(?:-USD)?)*[.!]?")
+# Upper-case words that are answers, asset classes or indicator names rather than tickers. Real tickers
+# among them (e.g. ALL) are still handled, just by the LLM with the full context.
+_NON_TICKER_WORDS = frozenset(
+    (
+        # Answers and filler words
+        *("I", "A", "OK", "YES", "NO", "YEP", "YEAH", "NAH", "NOPE", "SURE", "MAYBE", "IDK", "NA", "ALL", "ANY"),
+        *("NONE", "BOTH", "SOME", "MIX", "DONT", "DO", "NOT", "CARE", "YOU", "PICK", "AND", "OR", "THE", "FOR"),
+        *("TO", "OF", "IN", "ON", "IT", "IS", "ME", "MY", "JUST", "ONLY", "SKIP", "NEXT", "DONE", "HELP"),
+        *("STOP", "WAIT", "HI", "HELLO"),
+        # Asset classes, markets and currencies
+        *("AI", "ETF", "ETFS", "TECH", "STOCK", "BONDS", "FOREX", "FX", "OIL", "US", "USA", "EU", "UK", "USD"),
+        *("EUR", "BTC", "ETH", "IPO", "YTD"),
+        # Indicators
+        *("RSI", "MACD", "SMA", "EMA", "ATR", "ADX", "CCI", "MFI", "OBV", "VWAP", "BB", "STOCH"),
+    )
+)
+# Ticker list for AI-managed results; shared, since the result is only read and serialized
+_EMPTY_TICKERS: tuple[str, ...] = ()
+# Form fields every backtest needs once the strategy type is known (also the fallback missing list)
+_BACKTEST_REQUIRED_FIELDS = ("strategy_description", "capital", "start_date", "end_date")
+# Form fields the fast path requires per intent; live trading runs from now on, so it needs no dates
+_REQUIRED_FIELDS_BY_INTENT = MappingProxyType(
+    {"backtest": _BACKTEST_REQUIRED_FIELDS, "live_trading": ("strategy_description", "capital")}
+)
+# Shortest usable strategy_description per strategy type: preferences may be short ("I like
+# stonks"), technical strategies need actual rules
+_MIN_DESCRIPTION_LENGTH = MappingProxyType({"agent_managed": 3, "technical_strategy": 15})
+
+# Clarification questions added while validating the LLM extraction or on the fast path; copied before use.
+
+# Agent-managed strategy without usable preferences
+_Q_PREFERENCES = MappingProxyType(
+    {
+        "question": "What are your trading preferences? (e.g., 'I like crypto', 'aggressive tech stocks', 'safe blue chips')",
+        "field": "strategy_description",
+        "suggestions": _PREFERENCE_SUGGESTIONS,
+        "field_type": "text",
+    }
+)
+# Technical strategy without concrete rules
+_Q_TECHNICAL_RULES = MappingProxyType(
+    {
+        "question": "Please describe your technical strategy with specific rules (e.g., 'Buy when RSI < 30 and MACD crosses, sell at 10% profit or 5% stop-loss')",
+        "field": "strategy_description",
+        "suggestions": (),
+        "field_type": "textarea",
+    }
+)
+# Analysis request without a subject
+_Q_ANALYSIS_TARGET = MappingProxyType(
+    {
+        "question": "What would you like me to analyze? (e.g., 'Bitcoin', 'AAPL', 'tech sector')",
+        "field": "strategy_description",
+        "suggestions": (),
+        "field_type": "text",
+    }
+)
+# Agent-managed strategy whose asset preference is only slang
+_Q_ASSET_KIND = MappingProxyType(
+    {
+        "question": "What kind of assets would you like to trade?",
+        "field": "asset_preferences",
+        "suggestions": _ASSET_SUGGESTIONS,
+        "field_type": "select",
+    }
+)
+# Agent-managed strategy without an asset preference
+_Q_ASSET_WHAT = MappingProxyType(
+    {
+        "question": "What would you like to trade?",
+        "field": "asset_preferences",
+        "suggestions": _ASSET_SUGGESTIONS,
+        "field_type": "select",
+    }
+)
+# Technical strategy without tickers
+_Q_ASSET_TICKERS = MappingProxyType(
+    {
+        "question": "What tickers would you like to trade? (e.g., 'AAPL, MSFT')",
+        "field": "asset_preferences",
+        "suggestions": (),
+        "field_type": "text",
+    }
+)
+# Question for a missing or too short strategy_description, per strategy type
+_DESCRIPTION_QUESTIONS = MappingProxyType({"agent_managed": _Q_PREFERENCES, "technical_strategy": _Q_TECHNICAL_RULES})
+
+
+def _date_reference(today: datetime) -> str:
+    """Build the date-dependent tail of the system prompt."""
+    current_year = today.year
+    today_str = today.strftime("%Y-%m-%d")
+    six_months_ago = (today - timedelta(days=180)).strftime("%Y-%m-%d")
+    return f"""
+
+**Date Reference:**
+- Today's date is {today_str}
+- "last 2 years" → {current_year - 2}-01-01 to {today_str}
+- "last year" → {current_year - 1}-01-01 to {current_year - 1}-12-31
+- "YTD" / "this year" → {current_year}-01-01 to {today_str}
+- "last 6 months" → {six_months_ago} to {today_str}"""
+
+
+def create_parameter_extraction_agent(llm, use_cache: bool = False):
+    """
+    Create a parameter extraction agent.
+
+    Args:
+        llm: The language model to use for extraction
+        use_cache: Reuse the result of an identical earlier request (same normalized message,
+            conversation context, form state, model and day) instead of calling the LLM again. Off by
+            default, like the strategy code cache, so resending a message gets a fresh extraction
+            instead of replaying one that may have been wrong.
+
+    Returns:
+        A callable agent that extracts parameters from natural language
+    """
+
+    today = datetime.now()
+    today_str = today.strftime("%Y-%m-%d")
+    date_reference = _date_reference(today)
+    system_prompt = _STATIC_SYSTEM_PROMPT + date_reference
+
+    # The static instructions come first and are byte-identical across calls so providers can reuse
+    # their cached prefix; Anthropic needs the cacheable block marked explicitly.
+    system_message = cacheable_system_message(llm, _STATIC_SYSTEM_PROMPT, date_reference)
 
     class ParameterExtractionAgent:
         """Parameter extraction agent with conversation context support."""
 
-        def __init__(self, llm_instance):
+        __slots__ = ("_chain", "_model_id", "_prompt_template", "llm", "system_message", "system_prompt", "use_cache")
+
+        def __init__(self, llm_instance, use_cache: bool = False):
             self.llm = llm_instance
             self.system_prompt = system_prompt
+            self.system_message = system_message
+            self.use_cache = use_cache
+            self._model_id = str(getattr(llm_instance, "model_name", None) or getattr(llm_instance, "model", ""))
+            # The prompt only varies by its inputs, so build the template and chain once per agent
+            self._prompt_template = ChatPromptTemplate.from_messages(
+                [
+                    self.system_message,
+                    ("human", "{user_message}{conversation_context}"),
+                ]
+            )
+            self._chain = self._prompt_template | llm_instance
 
         def _build_conversation_context(self, conversation_history: list[dict]) -> str:
             """Build conversation context string from message history."""
             if not conversation_history:
                 return ""
 
-            context = "\n\nConversation history:\n"
-            # Use last 5 messages for context
-            for msg in conversation_history[-5:]:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                context += f"{role}: {content}\n"
-
-            return context
+            # Use last 5 messages for context (short histories are used as-is, without slicing)
+            recent = conversation_history[-5:] if len(conversation_history) > 5 else conversation_history
+            parts = ["\n\nConversation history:\n"]
+            parts.extend(f"{msg.get('role', 'user')}: {msg.get('content', '')}\n" for msg in recent)
+            return "".join(parts)
 
         def _clean_json_response(self, response_text: str) -> str:
             """Clean up response text to extract valid JSON."""
             response_text = response_text.strip()
 
-            # Remove markdown code blocks if present
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+            # Remove markdown code blocks if present: keep what follows the first fence, up to the next one
+            _, fence, body = response_text.partition("```json")
+            if not fence:
+                _, fence, body = response_text.partition("```")
+            if fence:
+                response_text = body.partition("```")[0].strip()
 
             return response_text
 
         def _generate_clarification_questions(self, missing_fields: list[str]) -> list[dict]:
             """Generate clarification questions for missing fields."""
             questions = []
+            seen = set()
 
             for field in missing_fields:
-                if field == "strategy_type":
-                    questions.append(
+                key = "dates" if field in _DATE_FIELDS else field
+                template = _QUESTION_TEMPLATES.get(key)
+                if template is None or key in seen:  # Unknown field or already asked (dates)
+                    continue
+                seen.add(key)
+                # Fresh dict per question so callers can edit it without touching the template
+                questions.append(dict(template))
+
+            return questions
+
+        def _validate_plausibility(self, result_dict: dict) -> dict:
+            """Validate extracted parameters for plausibility and add clarification questions."""
+            extracted = result_dict["extracted"]
+            # Questions raised here go in front of the existing ones, most recent first. Collect them
+            # and prepend once at the end instead of repeatedly inserting at index 0.
+            priority = []
+
+            # Only run the checks for the parameters that were actually extracted
+            capital = extracted.get("capital")
+            if capital is not None:
+                self._check_capital(capital, priority)
+
+            if extracted.get("start_date") or extracted.get("end_date"):
+                self._check_dates(extracted, priority)
+
+            strategy_desc = extracted.get("strategy_description")
+            if strategy_desc and extracted.get("strategy_type") == "technical_strategy":
+                self._check_strategy(strategy_desc, priority)
+
+            if priority:
+                result_dict["needs_clarification"] = True
+                priority.reverse()
+                result_dict["clarification_questions"] = priority + result_dict["clarification_questions"]
+
+            return result_dict
+
+        def _check_capital(self, capital, priority: list[dict]) -> None:
+            """Question capital amounts that look like a mistake."""
+            if capital < 1000:
+                # Very low capital - likely a mistake
+                priority.append(
+                    {
+                        "question": f"You specified ${capital} capital. Did you mean ${capital},000? For backtesting, typical amounts are $10k-$100k+.",
+                        "field": "capital_confirmation",
+                        "suggestions": [capital * 1000, 10000, 50000],
+                        "field_type": "number",
+                    }
+                )
+            elif capital > 10000000:
+                # Very high capital - confirm
+                priority.append(
+                    {
+                        "question": f"You specified ${capital:,} (${capital / 1000000:.1f} million). Is this correct? That's a very large amount for backtesting.",
+                        "field": "capital_confirmation",
+                        "suggestions": (),
+                        "field_type": "text",
+                    }
+                )
+
+        def _check_dates(self, extracted: dict, priority: list[dict]) -> None:
+            """Question future, very old, reversed or very short date ranges, dropping invalid dates."""
+            start_date = extracted.get("start_date")
+            end_date = extracted.get("end_date")
+            today = datetime.now()
+            # Each date is parsed once; unparseable or non-string dates are skipped
+            start_dt = _parse_iso(start_date) if start_date and isinstance(start_date, str) else None
+            end_dt = _parse_iso(end_date) if end_date and isinstance(end_date, str) else None
+
+            if start_dt is not None:
+                # Future date check
+                if start_dt > today:
+                    priority.append(
                         {
-                            "question": "What type of trading strategy would you like?",
-                            "field": "strategy_type",
-                            "suggestions": [
-                                "AI Managed (I set preferences, AI makes trades)",
-                                "Technical Strategy (I define specific rules)",
-                            ],
-                            "field_type": "select",
+                            "question": f"Start date {start_date} is in the future. Backtests can only use historical data. Did you mean a past date?",
+                            "field": "start_date",
+                            "suggestions": (),
+                            "field_type": "date",
                         }
                     )
-                elif field == "strategy_description":
-                    questions.append(
+                    # Remove invalid date
+                    del extracted["start_date"]
+
+                # Very old date check (> 20 years)
+                if start_dt < today - timedelta(days=365 * 20):
+                    priority.append(
                         {
-                            "question": "Please describe your trading strategy (e.g., 'Momentum strategy for tech stocks' or 'Buy when RSI < 30, sell when RSI > 70')",
-                            "field": "strategy_description",
-                            "suggestions": [],
-                            "field_type": "textarea",
+                            "question": f"Start date {start_date} is over 20 years ago. Limited data may be available. Is this intentional?",
+                            "field": "date_confirmation",
+                            "suggestions": (),
+                            "field_type": "text",
                         }
                     )
-                elif field == "capital":
-                    questions.append(
+
+            if end_dt is not None:
+                # Future date check
+                if end_dt > today:
+                    priority.append(
                         {
-                            "question": "What initial capital would you like to use?",
-                            "field": "capital",
-                            "suggestions": [10000, 50000, 100000],
-                            "field_type": "number",
+                            "question": f"End date {end_date} is in the future. Backtests can only use historical data. Did you mean today's date ({today.strftime('%Y-%m-%d')})?",
+                            "field": "end_date",
+                            "suggestions": (),
+                            "field_type": "date",
                         }
                     )
-                elif field == "asset_preferences":
-                    questions.append(
+                    # Remove invalid date
+                    del extracted["end_date"]
+
+            # Check date ordering
+            if start_dt is not None and end_dt is not None:
+                if end_dt <= start_dt:
+                    priority.append(
                         {
-                            "question": "What would you like to trade? (e.g., 'AAPL, MSFT' or 'tech stocks' or 'crypto' or 'you choose')",
-                            "field": "asset_preferences",
-                            "suggestions": ["Tech Stocks", "Crypto", "Blue Chips", "You Choose"],
+                            "question": f"End date ({end_date}) must be after start date ({start_date}). Please provide valid date range.",
+                            "field": "dates",
+                            "suggestions": _DATE_PRESETS,
                             "field_type": "select",
                         }
                     )
-                elif field in ["start_date", "end_date", "dates"]:
-                    if "dates" not in [q["field"] for q in questions]:  # Avoid duplicates
-                        questions.append(
-                            {
-                                "question": "What time period for the backtest?",
-                                "field": "dates",
-                                "suggestions": ["Last 2 Years", "Last Year", "YTD", "Custom"],
-                                "field_type": "select",
-                            }
-                        )
+                    # Remove invalid dates
+                    if "start_date" in extracted:
+                        del extracted["start_date"]
+                    if "end_date" in extracted:
+                        del extracted["end_date"]
 
-            return questions
+                # Very short period check (< 30 days)
+                elif (end_dt - start_dt).days < 30:
+                    priority.append(
+                        {
+                            "question": f"Your date range is only {(end_dt - start_dt).days} days. This is very short for a backtest. Did you mean a longer period?",
+                            "field": "date_confirmation",
+                            "suggestions": _RECENT_PERIODS,
+                            "field_type": "select",
+                        }
+                    )
 
-        def _validate_plausibility(self, result_dict: dict) -> dict:
-            """Validate extracted parameters for plausibility and add clarification questions."""
-            from datetime import datetime, timedelta
+        def _check_strategy(self, strategy_desc: str, priority: list[dict]) -> None:
+            """Question technical strategies that are too vague, i.e. have no specifics (indicators, numbers, etc.)."""
+            desc_lower = strategy_desc.lower()
+            if _VAGUE_RX.search(desc_lower) and not _SPECIFICS_RX.search(desc_lower):
+                priority.append(
+                    {
+                        "question": f"Your strategy '{strategy_desc}' sounds like you want specific technical rules. Could you specify:\n• Which indicators? (RSI, MACD, moving averages, etc.)\n• Entry thresholds? (e.g., RSI < 30)\n• Exit rules? (profit target, stop loss, indicator levels)",
+                        "field": "strategy_details",
+                        "suggestions": (),
+                        "field_type": "textarea",
+                    }
+                )
 
-            extracted = result_dict["extracted"]
-            questions = result_dict["clarification_questions"]
+        def _fast_path(self, user_message: str, current_form_state: dict | None) -> dict | None:
+            """Handle a bare ticker list typed while filling a backtest form without calling the LLM.
 
-            # Validate capital
-            capital = extracted.get("capital")
-            if capital is not None:
-                if capital < 1000:
-                    # Very low capital - likely a mistake
-                    result_dict["needs_clarification"] = True
-                    questions.insert(
-                        0,
-                        {
-                            "question": f"You specified ${capital} capital. Did you mean ${capital},000? For backtesting, typical amounts are $10k-$100k+.",
-                            "field": "capital_confirmation",
-                            "suggestions": [capital * 1000, 10000, 50000],
-                            "field_type": "number",
-                        },
-                    )
-                elif capital > 10000000:
-                    # Very high capital - confirm
-                    result_dict["needs_clarification"] = True
-                    questions.insert(
-                        0,
-                        {
-                            "question": f"You specified ${capital:,} (${capital / 1000000:.1f} million). Is this correct? That's a very large amount for backtesting.",
-                            "field": "capital_confirmation",
-                            "suggestions": [],
-                            "field_type": "text",
-                        },
+            Returns None unless the form already has its strategy type and the message is only
+            upper-case ticker symbols (e.g. "AAPL, MSFT"), which the LLM would extract unchanged.
+            The chat form does not send an intent, so it is a backtest unless the form says
+            otherwise (live trading needs no dates). Missing fields follow the form's own flow.
+            """
+            if not current_form_state:
+                return None
+            intent = current_form_state.get("intent") or "backtest"
+            strategy_type = current_form_state.get("strategy_type")
+            required_fields = _REQUIRED_FIELDS_BY_INTENT.get(intent)
+            min_description_length = _MIN_DESCRIPTION_LENGTH.get(strategy_type)
+            if required_fields is None or min_description_length is None:
+                return None
+            message = user_message.strip()
+            if not _TICKER_ONLY_RX.fullmatch(message):
+                return None
+            tickers = list(dict.fromkeys(_TICKER_RX.findall(message)))
+            if not _NON_TICKER_WORDS.isdisjoint(tickers):
+                return None
+
+            description = current_form_state.get("strategy_description")
+            has_description = isinstance(description, str) and len(description.strip()) >= min_description_length
+            missing = [
+                field
+                for field in required_fields
+                if not (has_description if field == "strategy_description" else current_form_state.get(field))
+            ]
+            questions = self._generate_clarification_questions(
+                [field for field in missing if field != "strategy_description"]
+            )
+            if not has_description:
+                # Same flow-specific question as after an LLM extraction, asked first
+                questions.insert(0, dict(_DESCRIPTION_QUESTIONS[strategy_type]))
+
+            logger.info("Parameter extraction fast path - Tickers: %s, Missing: %d fields", tickers, len(missing))
+            return {
+                "intent": intent,
+                "extracted": {"ticker_list": tickers},
+                "missing": missing,
+                "confidence": {"ticker_list": 1.0},
+                "needs_clarification": bool(missing),
+                "clarification_questions": questions,
+                "suggested_defaults": {},
+            }
+
+        def _prepare(
+            self,
+            user_message: str,
+            conversation_history: list[dict] | None,
+            current_form_state: dict | None,
+        ) -> tuple[str, str | None, dict | None]:
+            """Build the conversation context and look up a cached result.
+
+            Returns:
+                (conversation_context, cache_key, cached result or None); cache_key is None when caching is off
+            """
+            conversation_context = self._build_conversation_context(conversation_history or [])
+
+            # Add form state to context if provided
+            if current_form_state:
+                filled_fields = {k: v for k, v in current_form_state.items() if v is not None and v != "" and v != []}
+                if filled_fields:
+                    conversation_context += "\n\nCurrent form state (already filled by user):\n"
+                    for field, value in filled_fields.items():
+                        conversation_context += f"- {field}: {value}\n"
+                    conversation_context += (
+                        "\nDo NOT re-extract these fields. Only extract NEW information from the user's message.\n"
                     )
 
-            # Validate dates
-            start_date = extracted.get("start_date")
-            end_date = extracted.get("end_date")
-            today = datetime.now()
+            return (conversation_context, *self._lookup_cache(user_message, conversation_context))
+
+        def _lookup_cache(self, user_message: str, conversation_context: str) -> tuple[str | None, dict | None]:
+            """Return (cache_key, cached result or None); cache_key is None when caching is off."""
+            if not self.use_cache:
+                return None, None
+
+            cache_key = _result_cache_key(self._model_id, today_str, user_message, conversation_context)
+            cached = _RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                # Another thread may have evicted the entry since the get()
+                with contextlib.suppress(KeyError):
+                    _RESULT_CACHE.move_to_end(cache_key)
+                logger.info("Parameter extraction cache hit - Intent: %s", cached["intent"])
+                # Callers may modify the result, so never hand out the cached object
+                cached = copy.deepcopy(cached)
+            return cache_key, cached
+
+        def _parse_response(self, result, user_message: str, cache_key: str | None) -> dict:
+            """Parse and validate the LLM response, caching the result under cache_key if given."""
+            try:
+                # Extract content
+                if hasattr(result, "content"):
+                    response_text = result.content
+                else:
+                    response_text = str(result)
 
-            if start_date:
-                try:
-                    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+                # Clean and parse JSON
+                cleaned_response = self._clean_json_response(response_text)
+                parsed = _json_loads(cleaned_response)
+            except json.JSONDecodeError as e:
+                logger.error("Failed to parse LLM response as JSON: %s", e)
+                logger.error("Response text: %s", cleaned_response[:500] if "cleaned_response" in locals() else "N/A")
+                return self._fallback_result(user_message)
 
-                    # Future date check
-                    if start_dt > today:
-                        result_dict["needs_clarification"] = True
-                        questions.insert(
-                            0,
-                            {
-                                "question": f"Start date {start_date} is in the future. Backtests can only use historical data. Did you mean a past date?",
-                                "field": "start_date",
-                                "suggestions": [],
-                                "field_type": "date",
-                            },
-                        )
-                        # Remove invalid date
-                        del extracted["start_date"]
+            result_dict = self._postprocess(parsed)
+            if cache_key is not None:
+                _cache_result(cache_key, result_dict)
+            return result_dict
 
-                    # Very old date check (> 20 years)
-                    if start_dt < today - timedelta(days=365 * 20):
-                        result_dict["needs_clarification"] = True
-                        questions.insert(
-                            0,
-                            {
-                                "question": f"Start date {start_date} is over 20 years ago. Limited data may be available. Is this intentional?",
-                                "field": "date_confirmation",
-                                "suggestions": [],
-                                "field_type": "text",
-                            },
-                        )
-                except:
-                    pass
-
-            if end_date:
-                try:
-                    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-                    # Future date check
-                    if end_dt > today:
+        def _postprocess(self, parsed: dict) -> dict:
+            """Normalize one parsed extraction and apply the flow-specific and plausibility checks."""
+            # Validate structure
+            result_dict = {
+                "intent": parsed.get("intent", "unclear"),
+                "extracted": parsed.get("extracted", {}),
+                "missing": parsed.get("missing", []),
+                "confidence": parsed.get("confidence", {}),
+                "needs_clarification": parsed.get("needs_clarification", False),
+                "clarification_questions": parsed.get("clarification_questions", []),
+                "suggested_defaults": parsed.get("suggested_defaults", {}),
+            }
+
+            # Fields that already have a clarification question / are already missing; kept in sync
+            # with the lists below
+            present_fields = {q.get("field") for q in result_dict["clarification_questions"]}
+            missing_set = set(result_dict["missing"])
+
+            # Validate strategy_description based on flow type
+            strategy_desc = result_dict["extracted"].get("strategy_description", "")
+            strategy_type = result_dict["extracted"].get("strategy_type")  # Don't default!
+            intent = result_dict.get("intent", "unclear")
+
+            # Add strategy_type to missing if not provided and intent is backtest
+            if intent == "backtest" and not strategy_type:
+                if "strategy_type" not in missing_set:
+                    missing_set.add("strategy_type")
+                    result_dict["missing"].insert(0, "strategy_type")  # Insert at front (ask first!)
+                    result_dict["needs_clarification"] = True
+
+            # Different validation based on flow type (only if strategy_type is known)
+            if strategy_type == "agent_managed":
+                # For agent-managed, even short preferences are OK (e.g., "I like stonks")
+                if not strategy_desc or len(strategy_desc.strip()) < _MIN_DESCRIPTION_LENGTH["agent_managed"]:
+                    if "strategy_description" in result_dict["extracted"]:
+                        del result_dict["extracted"]["strategy_description"]
+
+                    if "strategy_description" not in missing_set:
+                        missing_set.add("strategy_description")
+                        result_dict["missing"].append("strategy_description")
                         result_dict["needs_clarification"] = True
-                        questions.insert(
-                            0,
-                            {
-                                "question": f"End date {end_date} is in the future. Backtests can only use historical data. Did you mean today's date ({today.strftime('%Y-%m-%d')})?",
-                                "field": "end_date",
-                                "suggestions": [],
-                                "field_type": "date",
-                            },
-                        )
-                        # Remove invalid date
-                        del extracted["end_date"]
-                except:
-                    pass
 
-            # Check date ordering
-            if start_date and end_date:
-                try:
-                    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+                        if "strategy_description" not in present_fields:
+                            present_fields.add("strategy_description")
+                            result_dict["clarification_questions"].insert(0, dict(_Q_PREFERENCES))
 
-                    if end_dt <= start_dt:
+            elif strategy_type == "technical_strategy":
+                # For technical DSL, demand detailed rules
+                if not strategy_desc or len(strategy_desc.strip()) < _MIN_DESCRIPTION_LENGTH["technical_strategy"]:
+                    if "strategy_description" in result_dict["extracted"]:
+                        del result_dict["extracted"]["strategy_description"]
+
+                    if "strategy_description" not in missing_set:
+                        missing_set.add("strategy_description")
+                        result_dict["missing"].append("strategy_description")
                         result_dict["needs_clarification"] = True
-                        questions.insert(
-                            0,
-                            {
-                                "question": f"End date ({end_date}) must be after start date ({start_date}). Please provide valid date range.",
-                                "field": "dates",
-                                "suggestions": ["Last 2 Years", "Last Year", "YTD", "Custom"],
-                                "field_type": "select",
-                            },
-                        )
-                        # Remove invalid dates
-                        if "start_date" in extracted:
-                            del extracted["start_date"]
-                        if "end_date" in extracted:
-                            del extracted["end_date"]
-
-                    # Very short period check (< 30 days)
-                    elif (end_dt - start_dt).days < 30:
+
+                        if "strategy_description" not in present_fields:
+                            present_fields.add("strategy_description")
+                            result_dict["clarification_questions"].insert(0, dict(_Q_TECHNICAL_RULES))
+
+            elif intent == "analysis":
+                # For analysis, just need what to analyze
+                if not strategy_desc:
+                    if "strategy_description" in result_dict["extracted"]:
+                        del result_dict["extracted"]["strategy_description"]
+
+                    if "strategy_description" not in missing_set:
+                        missing_set.add("strategy_description")
+                        result_dict["missing"].append("strategy_description")
                         result_dict["needs_clarification"] = True
-                        questions.insert(
-                            0,
-                            {
-                                "question": f"Your date range is only {(end_dt - start_dt).days} days. This is very short for a backtest. Did you mean a longer period?",
-                                "field": "date_confirmation",
-                                "suggestions": ["Last 6 Months", "Last Year", "Last 2 Years"],
-                                "field_type": "select",
-                            },
-                        )
-                except:
-                    pass
-
-            # Validate strategy description vagueness (for technical strategies)
-            strategy_desc = extracted.get("strategy_description", "")
-            strategy_type = extracted.get("strategy_type")
-
-            if strategy_type == "technical_strategy" and strategy_desc:
-                # Check if strategy is too vague for technical DSL
-                vague_terms = ["momentum", "value", "growth", "trend", "swing"]
-                if any(term in strategy_desc.lower() for term in vague_terms):
-                    # Check if it has specifics (indicators, numbers, etc.)
-                    has_specifics = any(
-                        term in strategy_desc.lower()
-                        for term in [
-                            "rsi",
-                            "macd",
-                            "ema",
-                            "sma",
-                            "bollinger",
-                            "stochastic",
-                            "%",
-                            "threshold",
-                            "cross",
-                            "above",
-                            "below",
-                            ">=",
-                            "<=",
-                            "<",
-                            ">",
-                        ]
-                    )
 
-                    if not has_specifics:
+                        if "strategy_description" not in present_fields:
+                            present_fields.add("strategy_description")
+                            result_dict["clarification_questions"].insert(0, dict(_Q_ANALYSIS_TARGET))
+
+            # Validate asset preferences (skip for analysis intent)
+            if intent != "analysis":
+                ticker_list = result_dict["extracted"].get("ticker_list", [])
+                asset_prefs = result_dict["extracted"].get("asset_preferences", "")
+
+                # Convert list to string if needed
+                if isinstance(asset_prefs, list):
+                    asset_prefs = " ".join(asset_prefs) if asset_prefs else ""
+
+                prefs_lower = asset_prefs.lower().strip() if asset_prefs else ""
+
+                # Check if user said "you choose", "AI managed", "no", etc.
+                is_ai_managed = _AI_MANAGED_RX.search(prefs_lower) is not None
+
+                # Slang terms that need clarification
+                is_slang_only = prefs_lower in _SLANG_TERMS
+
+                # Check if description mentions specific tickers
+                # and clear asset class preferences (not slang), in one scan
+                desc_flags = _description_flags(strategy_desc.lower()) if strategy_desc else 0
+                has_tickers_in_desc = bool(desc_flags & _FLAG_TICKER)
+                has_clear_preference = bool(desc_flags & _FLAG_CLEAR_PREF)
+
+                # Check if description only contains slang (like "I like stonks")
+                desc_has_only_slang = desc_flags == _FLAG_SLANG
+
+                # Slang only is not enough - need clarification
+                if is_slang_only or desc_has_only_slang:
+                    has_asset_info = False
+                    # Remove slang from extracted
+                    if "asset_preferences" in result_dict["extracted"]:
+                        del result_dict["extracted"]["asset_preferences"]
+                else:
+                    has_asset_info = ticker_list or is_ai_managed or has_tickers_in_desc or has_clear_preference
+
+                    # For agent_managed, if they said something like "I like crypto", that's enough
+                    if strategy_type == "agent_managed" and has_clear_preference:
+                        has_asset_info = True
+
+                if not has_asset_info or is_slang_only or desc_has_only_slang:
+                    # Need to ask about assets
+                    if "asset_preferences" not in missing_set:
+                        missing_set.add("asset_preferences")
+                        result_dict["missing"].append("asset_preferences")
                         result_dict["needs_clarification"] = True
-                        questions.insert(
-                            0,
-                            {
-                                "question": f"Your strategy '{strategy_desc}' sounds like you want specific technical rules. Could you specify:\n• Which indicators? (RSI, MACD, moving averages, etc.)\n• Entry thresholds? (e.g., RSI < 30)\n• Exit rules? (profit target, stop loss, indicator levels)",
-                                "field": "strategy_details",
-                                "suggestions": [],
-                                "field_type": "textarea",
-                            },
-                        )
+
+                        # Add clarification question if not already present
+                        if "asset_preferences" not in present_fields:
+                            present_fields.add("asset_preferences")
+                            if strategy_type == "agent_managed":
+                                if is_slang_only or desc_has_only_slang:
+                                    result_dict["clarification_questions"].append(dict(_Q_ASSET_KIND))
+                                else:
+                                    result_dict["clarification_questions"].append(dict(_Q_ASSET_WHAT))
+                            else:
+                                result_dict["clarification_questions"].append(dict(_Q_ASSET_TICKERS))
+                elif is_ai_managed:
+                    # User wants AI to manage - update strategy description to reflect this
+                    if not _AI_MANAGED_DESC_RX.search(strategy_desc):
+                        result_dict["extracted"]["strategy_description"] = f"{strategy_desc} (AI-managed portfolio)"
+                    # Ensure ticker_list is empty for AI-managed
+                    result_dict["extracted"]["ticker_list"] = _EMPTY_TICKERS
+                    # Remove asset_preferences from missing if it's there
+                    if "asset_preferences" in missing_set:
+                        missing_set.discard("asset_preferences")
+                        result_dict["missing"].remove("asset_preferences")
+
+            # Plausibility checks
+            result_dict = self._validate_plausibility(result_dict)
+
+            logger.info(
+                "Parameter extraction successful - Intent: %s, Extracted: %d fields, Missing: %d fields",
+                result_dict["intent"],
+                len(result_dict["extracted"]),
+                len(result_dict["missing"]),
+            )
 
             return result_dict
 
+        def _fallback_result(self, user_message: str) -> dict:
+            """Result used when the LLM response is not valid JSON."""
+            # Fallback response - only include description if it's meaningful
+            extracted = {}
+            missing = list(_BACKTEST_REQUIRED_FIELDS)
+            confidence = {}
+
+            if user_message and len(user_message.strip()) > 10:
+                extracted["strategy_description"] = user_message
+                missing.remove("strategy_description")
+                confidence["strategy_description"] = 0.5
+
+            return {
+                "intent": "unclear",
+                "extracted": extracted,
+                "missing": missing,
+                "confidence": confidence,
+                "needs_clarification": True,
+                "clarification_questions": self._generate_clarification_questions(missing),
+                "suggested_defaults": {},
+            }
+
         def __call__(
             self,
             user_message: str,
@@ -511,307 +1052,128 @@ Generate specific questions for missing required fields:
             Returns:
                 Dictionary with extracted parameters, intent, missing fields, etc.
             """
-            conversation_history = conversation_history or []
-            current_form_state = current_form_state or {}
-            conversation_context = self._build_conversation_context(conversation_history)
+            fast_result = self._fast_path(user_message, current_form_state)
+            if fast_result is not None:
+                return fast_result
 
-            # Add form state to context if provided
-            if current_form_state:
-                filled_fields = {k: v for k, v in current_form_state.items() if v is not None and v != "" and v != []}
-                if filled_fields:
-                    conversation_context += "\n\nCurrent form state (already filled by user):\n"
-                    for field, value in filled_fields.items():
-                        conversation_context += f"- {field}: {value}\n"
-                    conversation_context += (
-                        "\nDo NOT re-extract these fields. Only extract NEW information from the user's message.\n"
-                    )
-
-            # Create prompt
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", self.system_prompt),
-                    ("human", "{user_message}{conversation_context}"),
-                ]
+            conversation_context, cache_key, cached = self._prepare(
+                user_message, conversation_history, current_form_state
             )
+            if cached is not None:
+                return cached
 
             try:
-                chain = prompt | self.llm
-                result = chain.invoke({"user_message": user_message, "conversation_context": conversation_context})
+                result = self._chain.invoke(
+                    {"user_message": user_message, "conversation_context": conversation_context}
+                )
+                return self._parse_response(result, user_message, cache_key)
+            except Exception:
+                logger.exception("Error in parameter extraction")
+                raise
 
-                # Extract content
-                if hasattr(result, "content"):
-                    response_text = result.content
-                else:
-                    response_text = str(result)
+        def extract_batch(
+            self,
+            user_messages: list[str],
+            conversation_history: list[dict] | None = None,
+        ) -> list[dict]:
+            """
+            Extract parameters for several independent messages with a single LLM call.
 
-                # Clean and parse JSON
-                cleaned_response = self._clean_json_response(response_text)
-                parsed = json.loads(cleaned_response)
-
-                # Validate structure
-                result_dict = {
-                    "intent": parsed.get("intent", "unclear"),
-                    "extracted": parsed.get("extracted", {}),
-                    "missing": parsed.get("missing", []),
-                    "confidence": parsed.get("confidence", {}),
-                    "needs_clarification": parsed.get("needs_clarification", False),
-                    "clarification_questions": parsed.get("clarification_questions", []),
-                    "suggested_defaults": parsed.get("suggested_defaults", {}),
-                }
-
-                # Validate strategy_description based on flow type
-                strategy_desc = result_dict["extracted"].get("strategy_description", "")
-                strategy_type = result_dict["extracted"].get("strategy_type")  # Don't default!
-                intent = result_dict.get("intent", "unclear")
-
-                # Add strategy_type to missing if not provided and intent is backtest
-                if intent == "backtest" and not strategy_type:
-                    if "strategy_type" not in result_dict["missing"]:
-                        result_dict["missing"].insert(0, "strategy_type")  # Insert at front (ask first!)
-                        result_dict["needs_clarification"] = True
+            The system prompt is sent once for the whole batch and messages with a cached result are
+            not sent at all. If the response is not a JSON array with one object per message, the
+            messages are extracted one by one instead.
 
-                # Different validation based on flow type (only if strategy_type is known)
-                if strategy_type == "agent_managed":
-                    # For agent-managed, even short preferences are OK (e.g., "I like stonks")
-                    if not strategy_desc or len(strategy_desc.strip()) < 3:
-                        if "strategy_description" in result_dict["extracted"]:
-                            del result_dict["extracted"]["strategy_description"]
-
-                        if "strategy_description" not in result_dict["missing"]:
-                            result_dict["missing"].append("strategy_description")
-                            result_dict["needs_clarification"] = True
-
-                            has_strategy_question = any(
-                                q.get("field") == "strategy_description" for q in result_dict["clarification_questions"]
-                            )
-                            if not has_strategy_question:
-                                result_dict["clarification_questions"].insert(
-                                    0,
-                                    {
-                                        "question": "What are your trading preferences? (e.g., 'I like crypto', 'aggressive tech stocks', 'safe blue chips')",
-                                        "field": "strategy_description",
-                                        "suggestions": [
-                                            "Aggressive growth",
-                                            "Conservative value",
-                                            "Tech & crypto",
-                                            "Blue chip stocks",
-                                        ],
-                                        "field_type": "text",
-                                    },
-                                )
-
-                elif strategy_type == "technical_strategy":
-                    # For technical DSL, demand detailed rules
-                    if not strategy_desc or len(strategy_desc.strip()) < 15:
-                        if "strategy_description" in result_dict["extracted"]:
-                            del result_dict["extracted"]["strategy_description"]
-
-                        if "strategy_description" not in result_dict["missing"]:
-                            result_dict["missing"].append("strategy_description")
-                            result_dict["needs_clarification"] = True
-
-                            has_strategy_question = any(
-                                q.get("field") == "strategy_description" for q in result_dict["clarification_questions"]
-                            )
-                            if not has_strategy_question:
-                                result_dict["clarification_questions"].insert(
-                                    0,
-                                    {
-                                        "question": "Please describe your technical strategy with specific rules (e.g., 'Buy when RSI < 30 and MACD crosses, sell at 10% profit or 5% stop-loss')",
-                                        "field": "strategy_description",
-                                        "suggestions": [],
-                                        "field_type": "textarea",
-                                    },
-                                )
-
-                elif intent == "analysis":
-                    # For analysis, just need what to analyze
-                    if not strategy_desc:
-                        if "strategy_description" in result_dict["extracted"]:
-                            del result_dict["extracted"]["strategy_description"]
-
-                        if "strategy_description" not in result_dict["missing"]:
-                            result_dict["missing"].append("strategy_description")
-                            result_dict["needs_clarification"] = True
-
-                            has_strategy_question = any(
-                                q.get("field") == "strategy_description" for q in result_dict["clarification_questions"]
-                            )
-                            if not has_strategy_question:
-                                result_dict["clarification_questions"].insert(
-                                    0,
-                                    {
-                                        "question": "What would you like me to analyze? (e.g., 'Bitcoin', 'AAPL', 'tech sector')",
-                                        "field": "strategy_description",
-                                        "suggestions": [],
-                                        "field_type": "text",
-                                    },
-                                )
-
-                # Validate asset preferences (skip for analysis intent)
-                if intent != "analysis":
-                    ticker_list = result_dict["extracted"].get("ticker_list", [])
-                    asset_prefs = result_dict["extracted"].get("asset_preferences", "")
-
-                    # Convert list to string if needed
-                    if isinstance(asset_prefs, list):
-                        asset_prefs = " ".join(asset_prefs) if asset_prefs else ""
-
-                    # Check if user said "you choose", "AI managed", "no", etc.
-                    ai_managed_phrases = [
-                        "you choose",
-                        "ai-managed",
-                        "ai managed",
-                        "doesn't matter",
-                        "don't care",
-                        "up to you",
-                        "surprise me",
-                        "you",
-                        "no preference",
-                        "no",
-                    ]
-                    is_ai_managed = (
-                        any(phrase in asset_prefs.lower().strip() for phrase in ai_managed_phrases)
-                        if asset_prefs
-                        else False
-                    )
+            Args:
+                user_messages: The user's natural language inputs
+                conversation_history: Previous messages for context, shared by all inputs (optional)
 
-                    # Slang terms that need clarification
-                    slang_terms = ["stonk", "stonks", "stock", "stocks"]
-                    is_slang_only = asset_prefs.lower().strip() in slang_terms if asset_prefs else False
+            Returns:
+                One result dictionary per message, in the same order
+            """
+            conversation_context = self._build_conversation_context(conversation_history or [])
+            results = []
+            pending = []  # (index, message, cache_key) of messages without a cached result
+            for index, message in enumerate(user_messages):
+                cache_key, cached = self._lookup_cache(message, conversation_context)
+                results.append(cached)
+                if cached is None:
+                    pending.append((index, message, cache_key))
+
+            if len(pending) <= 1:
+                for index, message, _ in pending:
+                    results[index] = self(message, conversation_history)
+                return results
+
+            inputs = "\n\n".join(f"Input {n}:\n{message}" for n, (_, message, _) in enumerate(pending, 1))
+            batch_message = (
+                f"Process these {len(pending)} inputs independently. Return a JSON array with one extraction "
+                f"object per input, in the same order, each in the format described above.\n\n{inputs}"
+            )
 
-                    # Check if description mentions specific tickers
-                    desc_lower = strategy_desc.lower() if strategy_desc else ""
-                    has_tickers_in_desc = any(
-                        term in desc_lower
-                        for term in ["aapl", "msft", "tsla", "googl", "amzn", "btc", "eth", "spy", "qqq"]
-                    )
+            try:
+                result = self._chain.invoke(
+                    {"user_message": batch_message, "conversation_context": conversation_context}
+                )
+                response_text = result.content if hasattr(result, "content") else str(result)
+                parsed = _json_loads(self._clean_json_response(response_text))
+            except json.JSONDecodeError:
+                parsed = None
+            except Exception:
+                logger.exception("Error in batch parameter extraction")
+                raise
 
-                    # Check for clear asset class preferences (not slang)
-                    has_clear_preference = any(
-                        term in desc_lower
-                        for term in [
-                            "tech stock",
-                            "technology stock",
-                            "crypto",
-                            "cryptocurrency",
-                            "blue chip",
-                            "small cap",
-                            "large cap",
-                            "etf",
-                            "s&p 500",
-                            "nasdaq",
-                            "bitcoin",
-                            "ethereum",
-                        ]
-                    )
+            matches_inputs = isinstance(parsed, list) and len(parsed) == len(pending)
+            if not matches_inputs or not all(isinstance(item, dict) for item in parsed):
+                logger.warning("Batch extraction response did not match %d inputs, extracting one by one", len(pending))
+                for index, message, _ in pending:
+                    results[index] = self(message, conversation_history)
+                return results
+
+            for (index, _, cache_key), item in zip(pending, parsed, strict=True):
+                result_dict = self._postprocess(item)
+                if cache_key is not None:
+                    _cache_result(cache_key, result_dict)
+                results[index] = result_dict
+            return results
+
+        async def acall(
+            self,
+            user_message: str,
+            conversation_history: list[dict] | None = None,
+            current_form_state: dict | None = None,
+        ) -> dict:
+            """
+            Async version of __call__; awaits the LLM instead of blocking the event loop.
 
-                    # Check if description only contains slang (like "I like stonks")
-                    desc_has_only_slang = (
-                        any(word in desc_lower for word in ["stonk", "stonks"])
-                        and not has_clear_preference
-                        and not has_tickers_in_desc
-                    )
+            Args:
+                user_message: The user's natural language input
+                conversation_history: Previous messages for context (optional)
+                current_form_state: Current state of the form to avoid re-extracting already filled fields (optional)
 
-                    # Slang only is not enough - need clarification
-                    if is_slang_only or desc_has_only_slang:
-                        has_asset_info = False
-                        # Remove slang from extracted
-                        if "asset_preferences" in result_dict["extracted"]:
-                            del result_dict["extracted"]["asset_preferences"]
-                    else:
-                        has_asset_info = ticker_list or is_ai_managed or has_tickers_in_desc or has_clear_preference
-
-                        # For agent_managed, if they said something like "I like crypto", that's enough
-                        if strategy_type == "agent_managed" and has_clear_preference:
-                            has_asset_info = True
-
-                    if not has_asset_info or is_slang_only or desc_has_only_slang:
-                        # Need to ask about assets
-                        if "asset_preferences" not in result_dict["missing"]:
-                            result_dict["missing"].append("asset_preferences")
-                            result_dict["needs_clarification"] = True
-
-                            # Add clarification question if not already present
-                            has_asset_question = any(
-                                q.get("field") == "asset_preferences" for q in result_dict["clarification_questions"]
-                            )
-                            if not has_asset_question:
-                                if strategy_type == "agent_managed":
-                                    if is_slang_only or desc_has_only_slang:
-                                        result_dict["clarification_questions"].append(
-                                            {
-                                                "question": "What kind of assets would you like to trade?",
-                                                "field": "asset_preferences",
-                                                "suggestions": ["Tech Stocks", "Crypto", "Blue Chips", "You Choose"],
-                                                "field_type": "select",
-                                            }
-                                        )
-                                    else:
-                                        result_dict["clarification_questions"].append(
-                                            {
-                                                "question": "What would you like to trade?",
-                                                "field": "asset_preferences",
-                                                "suggestions": ["Tech Stocks", "Crypto", "Blue Chips", "You Choose"],
-                                                "field_type": "select",
-                                            }
-                                        )
-                                else:
-                                    result_dict["clarification_questions"].append(
-                                        {
-                                            "question": "What tickers would you like to trade? (e.g., 'AAPL, MSFT')",
-                                            "field": "asset_preferences",
-                                            "suggestions": [],
-                                            "field_type": "text",
-                                        }
-                                    )
-                    elif is_ai_managed:
-                        # User wants AI to manage - update strategy description to reflect this
-                        if "AI will select" not in strategy_desc and "AI-managed" not in strategy_desc:
-                            result_dict["extracted"]["strategy_description"] = f"{strategy_desc} (AI-managed portfolio)"
-                        # Ensure ticker_list is empty for AI-managed
-                        result_dict["extracted"]["ticker_list"] = []
-                        # Remove asset_preferences from missing if it's there
-                        if "asset_preferences" in result_dict["missing"]:
-                            result_dict["missing"].remove("asset_preferences")
-
-                # Plausibility checks
-                result_dict = self._validate_plausibility(result_dict)
-
-                logger.info(
-                    f"Parameter extraction successful - Intent: {result_dict['intent']}, "
-                    f"Extracted: {len(result_dict['extracted'])} fields, "
-                    f"Missing: {len(result_dict['missing'])} fields"
-                )
+            Returns:
+                Dictionary with extracted parameters, intent, missing fields, etc.
+            """
+            fast_result = self._fast_path(user_message, current_form_state)
+            if fast_result is not None:
+                return fast_result
 
-                return result_dict
+            conversation_context, cache_key, cached = self._prepare(
+                user_message, conversation_history, current_form_state
+            )
+            if cached is not None:
+                return cached
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.error(f"Response text: {cleaned_response[:500] if 'cleaned_response' in locals() else 'N/A'}")
-
-                # Fallback response - only include description if it's meaningful
-                extracted = {}
-                missing = ["strategy_description", "capital", "start_date", "end_date"]
-                confidence = {}
-
-                if user_message and len(user_message.strip()) > 10:
-                    extracted["strategy_description"] = user_message
-                    missing.remove("strategy_description")
-                    confidence["strategy_description"] = 0.5
-
-                return {
-                    "intent": "unclear",
-                    "extracted": extracted,
-                    "missing": missing,
-                    "confidence": confidence,
-                    "needs_clarification": True,
-                    "clarification_questions": self._generate_clarification_questions(missing),
-                    "suggested_defaults": {},
-                }
-
-            except Exception as e:
-                logger.exception(f"Error in parameter extraction: {e}")
+            try:
+                result = await self._chain.ainvoke(
+                    {"user_message": user_message, "conversation_context": conversation_context}
+                )
+                return self._parse_response(result, user_message, cache_key)
+            except Exception:
+                logger.exception("Error in parameter extraction")
                 raise
 
-    return ParameterExtractionAgent(llm)
+        async def abatch(self, requests: list[tuple[str, list[dict] | None]]) -> list[dict]:
+            """Extract parameters for several (user_message, conversation_history) pairs concurrently."""
+            return await asyncio.gather(*(self.acall(message, history) for message, history in requests))
+
+    return ParameterExtractionAgent(llm, use_cache)
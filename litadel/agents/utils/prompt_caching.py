@@ -0,0 +1,40 @@
+"""Helpers for letting LLM providers cache the static prefix of a system prompt."""
+
+from langchain_core.messages import SystemMessage
+
+
+def uses_anthropic_prompt_caching(llm) -> bool:
+    """Whether the model needs explicit cache_control markers to cache the system prompt prefix.
+
+    True for ChatAnthropic and for Claude models reached through an OpenAI-compatible gateway
+    (e.g. OpenRouter), which forwards the markers. OpenAI models cache matching prefixes automatically.
+    """
+    if getattr(llm, "_llm_type", "") == "anthropic-chat":
+        return True
+    model_id = getattr(llm, "model_name", None) or getattr(llm, "model", None) or ""
+    return "claude" in str(model_id).lower()
+
+
+def cacheable_system_message(llm, static_text: str, dynamic_text: str = "") -> SystemMessage:
+    """
+    Build a system message whose static part can be served from the provider's prompt cache.
+
+    The static text must be byte-identical across calls and comes first; anything that changes
+    per call (e.g. today's date) goes in dynamic_text after it. For models that need it, the
+    static block is marked with an ephemeral cache_control.
+
+    Args:
+        llm: The language model the message is sent to
+        static_text: Instructions shared by every call
+        dynamic_text: Text appended after the static part (optional)
+
+    Returns:
+        SystemMessage with plain text content, or text blocks for Anthropic-style caching
+    """
+    if not uses_anthropic_prompt_caching(llm):
+        return SystemMessage(content=static_text + dynamic_text)
+
+    blocks = [{"type": "text", "text": static_text, "cache_control": {"type": "ephemeral"}}]
+    if dynamic_text:
+        blocks.append({"type": "text", "text": dynamic_text})
+    return SystemMessage(content=blocks)
@@ -4,21 +4,162 @@ This agent generates pure Python code for backtesting.py Strategy classes.
 It does NOT chat - it only generates code based on structured requirements.
 """
 
+import ast
+import atexit
+import builtins
+import contextlib
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 
+from litadel.agents.utils.prompt_caching import cacheable_system_message, uses_anthropic_prompt_caching
 
-def create_strategy_code_generator(llm):
+try:
+    # orjson is optional; it serializes the cache key requirements much faster than json
+    import orjson
+
+    def _canonical_json(value) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+except ImportError:
+
+    def _canonical_json(value) -> bytes:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+# Generated code per (model, requirements) hash, most recently used last; shared by all generators
+_CODE_CACHE: OrderedDict[str, str] = OrderedDict()
+_CODE_CACHE_MAXSIZE = 512
+
+# Opening fence at the start or closing fence at the end of (stripped) generated code
+_FENCE_EDGES_RE = re.compile(r"\A```(?:python)?|```\Z")
+# Body of the first fenced block in a response, up to the closing fence or the end if it is cut off
+_FENCED_BLOCK_RE = re.compile(r"```(?:python)?(.*?)(?:```|\Z)", re.DOTALL)
+
+# Built-in indicator used as self.I(NAME, ...) or called as NAME(...); one group per form
+_INDICATOR_USE_RE = re.compile(r"self\.I\((SMA|EMA|RSI|MACD|BBANDS)\b|\b(SMA|EMA|RSI|MACD|BBANDS)\(")
+# Names imported by "from backtesting.test import ..." lines
+_TEST_IMPORT_RE = re.compile(r"^from backtesting\.test import (.+)$", re.MULTILINE)
+_NAME_RE = re.compile(r"\w+")
+# Existing Strategy / crossover imports, also when imported together with other names
+_STRATEGY_IMPORT_RE = re.compile(r"^\s*from backtesting import .*\bStrategy\b", re.MULTILINE)
+_CROSSOVER_IMPORT_RE = re.compile(r"^\s*from backtesting\.lib import .*\bcrossover\b", re.MULTILINE)
+
+# Separator between alternative fixes in one fix response, and how many alternatives to ask for
+_VARIANT_MARKER = "# ---VARIANT---"
+_FIX_VARIANTS = 2
+
+
+def clear_strategy_code_cache() -> None:
+    """Drop cached generated code, e.g. after changing the system prompt or model configuration."""
+    _CODE_CACHE.clear()
+
+
+class _StrategyRequirements(NamedTuple):
+    """Everything a user prompt is built from, passed around as one value."""
+
+    strategy_description: str
+    ticker: str
+    indicators: list[str] | None
+    entry_conditions: dict | None
+    exit_conditions: dict | None
+    risk_params: dict | None
+
+
+def _code_cache_key(model_id: str, requirements: _StrategyRequirements) -> str:
+    """Hash everything the generated code depends on besides the (constant) system prompt.
+
+    Condition dicts are serialized with sorted keys and indicators are sorted, so requirements that
+    only differ in order share a key; nested values are serialized rather than needing to be hashable.
     """
-    Create a strategy code generator agent.
+    payload = _canonical_json(
+        [
+            model_id,
+            requirements.strategy_description,
+            requirements.ticker,
+            sorted(requirements.indicators or ()),
+            requirements.entry_conditions,
+            requirements.exit_conditions,
+            requirements.risk_params,
+        ]
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _cache_code(cache_key: str, code: str) -> None:
+    """Store generated code, evicting the least recently used entry when full.
+
+    Code that does not even compile is not stored, so the next request generates it again.
+    """
+    try:
+        compile(code, "<strategy>", "exec")
+    except (SyntaxError, ValueError):
+        return
+    _CODE_CACHE[cache_key] = code
+    if len(_CODE_CACHE) > _CODE_CACHE_MAXSIZE:
+        _CODE_CACHE.popitem(last=False)
 
-    Args:
-        llm: The language model to use for generation
 
-    Returns:
-        A function that takes strategy requirements and returns Python code
+def _conditions_section(title: str, conditions: dict) -> str:
+    """Format a requirements dict as a titled bullet list for the user prompt, or "" if it is empty."""
+    if not conditions:
+        return ""
+    items = "\n".join(f"  - {key}: {value}" for key, value in conditions.items())
+    return f"\n**{title}:**\n{items}"
+
+
+def _strip_code_fences(chunks):
     """
+    Yield streamed text with the same fences and surrounding whitespace removed as _clean_code_output.
 
-    system_prompt = """You are an expert Python code generator for algorithmic trading strategies
+    Text is only held back while it could still be part of the opening fence (at the start) or of
+    the closing fence and trailing whitespace (at the end); everything else is passed through.
+    """
+    head = []  # Text received before the opening fence is ruled in or out
+    at_start = True  # Nothing but whitespace emitted yet
+    tail = ""  # Trailing whitespace and backticks that may belong to the closing fence
+
+    for chunk in chunks:
+        piece = chunk
+        if head is not None:
+            head.append(chunk)
+            text = "".join(head).lstrip()
+            if "```python".startswith(text):
+                continue
+            head = None
+            piece = _FENCE_EDGES_RE.sub("", text, count=1) if text.startswith("```") else text
+
+        if at_start:
+            piece = piece.lstrip()
+            if not piece:
+                continue
+            at_start = False
+
+        text = tail + piece
+        body = text.rstrip(" \t\r\n`")
+        tail = text[len(body) :]
+        if body:
+            yield body
+
+    if head is not None:
+        # The whole response was shorter than an opening fence
+        rest = _FENCE_EDGES_RE.sub("", "".join(head).strip()).strip()
+    else:
+        rest = tail.rstrip().removesuffix("```").rstrip()
+    if rest:
+        yield rest
+
+
+# System prompt shared by every generator; kept byte-identical so providers can cache it
+_SYSTEM_PROMPT = """You are an expert Python code generator for algorithmic trading strategies
 using the backtesting.py library.
 
 Your ONLY task is to generate clean, executable Python code for backtesting.py Strategy classes.
@@ -31,7 +172,7 @@ from backtesting import Strategy
 from backtesting.lib import crossover
 from backtesting.test import SMA
 
-class {{StrategyName}}(Strategy):
+class {StrategyName}(Strategy):
     # Strategy parameters (can be optimized)
     param1 = 10
     param2 = 20
@@ -365,64 +506,88 @@ def next(self):
 Now generate the requested strategy code based on the requirements provided.
 """
 
-    class StrategyCodeGenerator:
-        """Strategy code generator with streaming support."""
 
-        def __init__(self, llm):
-            self.llm = llm
+# System message per "needs cache_control markers" flag, built on first use and shared by all generators
+_SYSTEM_MESSAGES = {}
 
-        def _build_prompt(
-            self,
-            strategy_description: str,
-            ticker: str,
-            indicators: list[str],
-            entry_conditions: dict,
-            exit_conditions: dict,
-            risk_params: dict,
-        ) -> str:
-            """Build the user prompt with strategy requirements."""
 
-            prompt_parts = [
-                f"Generate a backtesting.py Strategy class for {ticker}.",
-                f"\n**Strategy Description:** {strategy_description}",
-            ]
+def _system_message(llm):
+    """Return the shared system message for the model, so every request sends the identical prefix."""
+    needs_markers = uses_anthropic_prompt_caching(llm)
+    message = _SYSTEM_MESSAGES.get(needs_markers)
+    if message is None:
+        message = _SYSTEM_MESSAGES[needs_markers] = cacheable_system_message(llm, _SYSTEM_PROMPT)
+    return message
 
-            if indicators:
-                prompt_parts.append(f"\n**Indicators:** {', '.join(indicators)}")
 
-            if entry_conditions:
-                prompt_parts.append("\n**Entry Conditions:**")
-                for key, value in entry_conditions.items():
-                    prompt_parts.append(f"  - {key}: {value}")
+def create_strategy_code_generator(llm, use_cache: bool = False):
+    """
+    Create a strategy code generator agent.
 
-            if exit_conditions:
-                prompt_parts.append("\n**Exit Conditions:**")
-                for key, value in exit_conditions.items():
-                    prompt_parts.append(f"  - {key}: {value}")
+    Args:
+        llm: The language model to use for generation
+        use_cache: Reuse the code generated for an identical earlier request (same requirements and
+            model) instead of calling the LLM again. Off by default, so asking again with the same
+            requirements (e.g. "generate" clicked twice) gets a fresh attempt.
 
-            if risk_params:
-                prompt_parts.append("\n**Risk Management:**")
-                for key, value in risk_params.items():
-                    prompt_parts.append(f"  - {key}: {value}")
+    Returns:
+        A function that takes strategy requirements and returns Python code
+    """
 
-            prompt_parts.append("\n\nGenerate ONLY the Python code. No explanations, no markdown fences.")
+    class StrategyCodeGenerator:
+        """Strategy code generator with streaming support."""
 
-            return "\n".join(prompt_parts)
+        def __init__(self, llm, use_cache: bool = False):
+            self.llm = llm
+            self.use_cache = use_cache
+            self._model_id = str(getattr(llm, "model_name", None) or getattr(llm, "model", ""))
+            # The system message is the same for every request and has no variables, so the messages
+            # are passed to the model directly instead of formatting a prompt template per call
+            self._system_message = _system_message(llm)
 
-        def _clean_code_output(self, code_output: str) -> str:
-            """Clean the generated code output."""
-            # Remove markdown code fences if present
-            code_output = code_output.strip()
+        def _build_prompt(self, requirements: _StrategyRequirements) -> str:
+            """Build the user prompt with strategy requirements."""
 
-            if code_output.startswith("```python"):
-                code_output = code_output[len("```python") :]
-            elif code_output.startswith("```"):
-                code_output = code_output[len("```") :]
+            # One string per section; empty sections are left out
+            sections = (
+                f"Generate a backtesting.py Strategy class for {requirements.ticker}.",
+                f"\n**Strategy Description:** {requirements.strategy_description}",
+                f"\n**Indicators:** {', '.join(requirements.indicators)}" if requirements.indicators else "",
+                _conditions_section("Entry Conditions", requirements.entry_conditions),
+                _conditions_section("Exit Conditions", requirements.exit_conditions),
+                _conditions_section("Risk Management", requirements.risk_params),
+                "\n\nGenerate ONLY the Python code. No explanations, no markdown fences.",
+            )
+            return "\n".join(section for section in sections if section)
 
-            if code_output.endswith("```"):
-                code_output = code_output[: -len("```")]
+        def _prepare(self, requirements: _StrategyRequirements) -> tuple[str, str | None, str | None]:
+            """Build the user prompt and look up cached code; shared by __call__ and stream.
 
-            return code_output.strip()
+            Returns:
+                (user_prompt, cache_key, cached code or None); cache_key is None when caching is off
+            """
+            requirements = requirements._replace(
+                indicators=requirements.indicators or [],
+                entry_conditions=requirements.entry_conditions or {},
+                exit_conditions=requirements.exit_conditions or {},
+                risk_params=requirements.risk_params or {},
+            )
+            user_prompt = self._build_prompt(requirements)
+            if not self.use_cache:
+                return user_prompt, None, None
+
+            cache_key = _code_cache_key(self._model_id, requirements)
+            cached = _CODE_CACHE.get(cache_key)
+            if cached is not None:
+                # Another thread may have evicted the entry since the get()
+                with contextlib.suppress(KeyError):
+                    _CODE_CACHE.move_to_end(cache_key)
+            return user_prompt, cache_key, cached
+
+        def _clean_code_output(self, code_output: str) -> str:
+            """Clean the generated code output."""
+            # Remove markdown code fences if present
+            return _FENCE_EDGES_RE.sub("", code_output.strip()).strip()
 
         def __call__(
             self,
@@ -447,19 +612,15 @@ Now generate the requested strategy code based on the requirements provided.
             Returns:
                 Python code string
             """
-            indicators = indicators or []
-            entry_conditions = entry_conditions or {}
-            exit_conditions = exit_conditions or {}
-            risk_params = risk_params or {}
-
-            user_prompt = self._build_prompt(
-                strategy_description, ticker, indicators, entry_conditions, exit_conditions, risk_params
+            user_prompt, cache_key, cached = self._prepare(
+                _StrategyRequirements(
+                    strategy_description, ticker, indicators, entry_conditions, exit_conditions, risk_params
+                )
             )
+            if cached is not None:
+                return cached
 
-            prompt = ChatPromptTemplate.from_messages([("system", system_prompt), ("human", user_prompt)])
-
-            chain = prompt | self.llm
-            result = chain.invoke({})
+            result = self.llm.invoke([self._system_message, HumanMessage(content=user_prompt)])
 
             # Extract content
             if hasattr(result, "content"):
@@ -467,7 +628,10 @@ Now generate the requested strategy code based on the requirements provided.
             else:
                 code_output = str(result)
 
-            return self._clean_code_output(code_output)
+            code = self._clean_code_output(code_output)
+            if cache_key is not None:
+                _cache_code(cache_key, code)
+            return code
 
         def stream(
             self,
@@ -485,38 +649,279 @@ Now generate the requested strategy code based on the requirements provided.
                 Same as __call__
 
             Yields:
-                String chunks as they're generated by the LLM
+                Code chunks as they're generated by the LLM, without markdown fences (a cached result is
+                yielded as one chunk)
             """
-            indicators = indicators or []
-            entry_conditions = entry_conditions or {}
-            exit_conditions = exit_conditions or {}
-            risk_params = risk_params or {}
-
-            user_prompt = self._build_prompt(
-                strategy_description, ticker, indicators, entry_conditions, exit_conditions, risk_params
+            user_prompt, cache_key, cached = self._prepare(
+                _StrategyRequirements(
+                    strategy_description, ticker, indicators, entry_conditions, exit_conditions, risk_params
+                )
+            )
+            if cached is not None:
+                yield cached
+                return
+
+            # Stream chunks from the LLM, stripping markdown fences as they arrive
+            contents = (
+                chunk.content if hasattr(chunk, "content") else str(chunk)
+                for chunk in self.llm.stream([self._system_message, HumanMessage(content=user_prompt)])
             )
+            parts = []
+            for content in _strip_code_fences(contents):
+                parts.append(content)
+                yield content
 
-            prompt = ChatPromptTemplate.from_messages([("system", system_prompt), ("human", user_prompt)])
+            # Only a completed stream is cached; an abandoned generator never gets here
+            if cache_key is not None:
+                _cache_code(cache_key, "".join(parts))
 
-            chain = prompt | self.llm
+    return StrategyCodeGenerator(llm, use_cache)
 
-            # Track if we need to strip markdown fences
-            accumulated = ""
 
-            # Stream chunks from the LLM
-            for chunk in chain.stream({}):
-                if hasattr(chunk, "content"):
-                    content = chunk.content
-                else:
-                    content = str(chunk)
+# Idle Docker sandboxes kept running between validations, as (session, container time when it was
+# last reset). Sessions are taken out of the pool for a run, so concurrent validations (one per
+# backtest worker) each use their own container.
+_SANDBOX_POOL = []
+_SANDBOX_POOL_SIZE = int(os.getenv("MAX_CONCURRENT_BACKTESTS", "2"))
+_SANDBOX_LOCK = threading.Lock()
+_SANDBOX_LIBRARIES = ["backtesting", "pandas", "numpy"]
+_SANDBOX_WORKDIR = "/sandbox"
+# Run after every validation: recreates the work directory (where the code is written, and so the
+# first entry on sys.path), succeeds only if nothing else in the container changed since the last
+# reset and prints the container time. ctime is set by the kernel, so a run cannot backdate its files.
+_SANDBOX_RESET_COMMAND = (
+    "sh -c 'rm -rf {workdir} && mkdir -p {workdir} && "
+    'test -z "$(find / -xdev -mindepth 1 -path {workdir} -prune -o -newerct @{since} -print -quit)" && '
+    "date +%s.%N'"
+)
 
-                if content:
-                    accumulated += content
-                    # Clean and yield
-                    # For streaming, we'll yield raw content and clean at the end
-                    yield content
 
-    return StrategyCodeGenerator(llm)
+def _close_session(session) -> None:
+    with contextlib.suppress(Exception):
+        session.close()
+
+
+def _close_sandboxes() -> None:
+    """Stop the idle sandbox containers."""
+    with _SANDBOX_LOCK:
+        sessions = _SANDBOX_POOL[:]
+        _SANDBOX_POOL.clear()
+    for session, _ in sessions:
+        _close_session(session)
+
+
+atexit.register(_close_sandboxes)
+
+
+def _run_in_sandbox(code: str):
+    """
+    Run code in an idle Docker sandbox, starting one (and installing libraries) if none is free.
+
+    Each run is a separate Python process, but files it writes stay in the container (e.g. a
+    backtesting.py dropped next to the code would shadow the library in the next run). After a run
+    the work directory is recreated, and the container only goes back to the pool if the run changed
+    nothing else; otherwise, or if the run fails, it is discarded. The lock only guards the pool, not
+    the run.
+    """
+    from llm_sandbox import SandboxSession
+
+    with _SANDBOX_LOCK:
+        session, since = _SANDBOX_POOL.pop() if _SANDBOX_POOL else (None, None)
+
+    if session is None:
+        session = SandboxSession(lang="python", verbose=False, workdir=_SANDBOX_WORKDIR)
+        session.open()
+        try:
+            # Install the libraries before the run, so the install does not count as a change it made
+            setup = session.run("import time; print(time.time())", libraries=_SANDBOX_LIBRARIES)
+            since = setup.stdout.strip()
+        except Exception:
+            _close_session(session)
+            raise
+
+    try:
+        result = session.run(code)
+        reset = session.execute_command(
+            _SANDBOX_RESET_COMMAND.format(workdir=_SANDBOX_WORKDIR, since=since), workdir="/"
+        )
+    except Exception:
+        _close_session(session)
+        raise
+
+    with _SANDBOX_LOCK:
+        keep = reset.exit_code == 0 and len(_SANDBOX_POOL) < _SANDBOX_POOL_SIZE
+        if keep:
+            _SANDBOX_POOL.append((session, reset.stdout.strip()))
+    if not keep:
+        _close_session(session)
+    return result
+
+
+# Validate in a local worker process instead of Docker. Only for trusted, self-hosted setups: the
+# generated code then runs unsandboxed on this machine.
+_LOCAL_VALIDATION = os.getenv("STRATEGY_VALIDATION_LOCAL", "false").lower() == "true"
+_LOCAL_VALIDATION_TIMEOUT = 10  # seconds
+
+# Worker process with the backtesting libraries already imported; created on first use
+_LOCAL_POOL = None
+_LOCAL_POOL_LOCK = threading.Lock()
+
+
+def _terminate_local_pool() -> None:
+    """Stop the current local worker process, if one is running."""
+    global _LOCAL_POOL  # noqa: PLW0603
+    with _LOCAL_POOL_LOCK:
+        pool = _LOCAL_POOL
+        _LOCAL_POOL = None
+    if pool is not None:
+        pool.terminate()
+
+
+atexit.register(_terminate_local_pool)
+
+
+def _preimport_validation_libraries() -> None:
+    """Import the libraries generated strategies use once per worker process."""
+    import backtesting  # noqa: F401, PLC0415
+    import numpy as np  # noqa: F401, PLC0415
+    import pandas as pd  # noqa: F401, PLC0415
+
+
+def _validate_in_process(code_string: str) -> tuple[bool, str]:
+    """Run the code in a fresh namespace and check it defines a Strategy subclass (runs in the worker)."""
+    from backtesting import Strategy  # noqa: PLC0415
+
+    namespace = {"__name__": "__strategy__"}
+    try:
+        exec(code_string, namespace)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+    for obj in namespace.values():
+        if isinstance(obj, type) and obj is not Strategy and issubclass(obj, Strategy):
+            return True, "Valid (local process)"
+    return False, "ValueError: No Strategy class found"
+
+
+def _execute_locally(code_string: str) -> tuple[bool, str]:
+    """Validate code in the shared local worker process; a worker that times out is replaced."""
+    global _LOCAL_POOL  # noqa: PLW0603
+    with _LOCAL_POOL_LOCK:
+        if _LOCAL_POOL is None:
+            _LOCAL_POOL = multiprocessing.Pool(processes=1, initializer=_preimport_validation_libraries)
+        pool = _LOCAL_POOL
+
+    try:
+        return pool.apply_async(_validate_in_process, (code_string,)).get(timeout=_LOCAL_VALIDATION_TIMEOUT)
+    except multiprocessing.TimeoutError:
+        # The worker is stuck in the generated code; kill it rather than queue more work behind it
+        with _LOCAL_POOL_LOCK:
+            if _LOCAL_POOL is pool:
+                _LOCAL_POOL = None
+        pool.terminate()
+        return False, f"Validation timed out after {_LOCAL_VALIDATION_TIMEOUT}s"
+
+
+# pandas Series methods LLMs tend to call on backtesting.py data arrays, which do not have them
+_PANDAS_ONLY_METHODS = frozenset({"diff", "shift", "pct_change", "rolling"})
+# Attributes of self.data that are real pandas objects (data.df, data.index) rather than data arrays
+_PANDAS_DATA_ATTRS = frozenset({"df", "index", "s"})
+_BUILTIN_NAMES = frozenset(dir(builtins))
+
+
+def _base_name(base: ast.expr) -> str:
+    """Name of a base class expression (Strategy or backtesting.Strategy), or "" for anything else."""
+    return base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", "")
+
+
+def _find_strategy_class(tree: ast.Module) -> str | None:
+    """
+    Return the name of the first class defined in the code with a Strategy base class, or None.
+
+    Bases are matched by name (Strategy, or library subclasses such as TrailingStrategy); the
+    sandbox checks the class really is a Strategy subclass.
+    """
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and any(_base_name(base).endswith("Strategy") for base in node.bases):
+            return node.name
+    return None
+
+
+def _is_data_array(node: ast.expr) -> bool:
+    """Whether the expression is self.data or one of its array columns (e.g. self.data.Close)."""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Attribute):
+        if node.attr in _PANDAS_DATA_ATTRS:
+            return False
+        node = node.value
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == "data"
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+    )
+
+
+def _bound_names(tree: ast.Module) -> set[str]:
+    """Every name the code binds (imports, definitions, assignments and arguments) plus the builtins."""
+    bound = set(_BUILTIN_NAMES)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            bound.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, ast.alias):
+            bound.add((node.asname or node.name).partition(".")[0])
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+    return bound
+
+
+def _static_validate(tree: ast.Module, strategy_name: str) -> str | None:
+    """
+    Check parsed code for mistakes that are certain to fail at runtime, without running it.
+
+    Returns:
+        Error message in the same "Type: message" form as the sandbox, or None if none was found
+    """
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    # init() and next() must come from the strategy or a base class defined in the code, unless
+    # it derives from a library strategy (e.g. TrailingStrategy) that provides them
+    methods = set()
+    name, seen, library_base = strategy_name, set(), False
+    while name in classes and name not in seen:
+        seen.add(name)
+        node = classes[name]
+        methods.update(item.name for item in node.body if isinstance(item, ast.FunctionDef))
+        base_names = [_base_name(base) for base in node.bases]
+        name = next((base for base in base_names if base in classes), None)
+        library_base = library_base or any(base.endswith("Strategy") and base != "Strategy" for base in base_names)
+    if not library_base:
+        for method in ("init", "next"):
+            if method not in methods:
+                return f"ValueError: Strategy missing {method}() method"
+
+    bound = _bound_names(tree)
+    # A star import can bind anything
+    check_names = "*" not in bound
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and node.attr in _PANDAS_ONLY_METHODS and _is_data_array(node.value):
+            return (
+                f"AttributeError: '_Array' object has no attribute '{node.attr}' (line {node.lineno}); "
+                "data arrays are not pandas Series, use array indexing like self.data.Close[-2]"
+            )
+        if not check_names:
+            continue
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id not in bound:
+            return f"NameError: name '{node.func.id}' is not defined (line {node.lineno})"
+        if isinstance(node, ast.ClassDef):
+            for base in node.bases:
+                if isinstance(base, ast.Name) and base.id not in bound:
+                    return f"NameError: name '{base.id}' is not defined (line {node.lineno})"
+    return None
 
 
 def execute_and_validate_code(code_string: str) -> tuple[bool, str]:
@@ -526,35 +931,48 @@ def execute_and_validate_code(code_string: str) -> tuple[bool, str]:
     REQUIRES: Docker must be installed and running.
     Install: https://docs.docker.com/get-docker/
 
+    Mistakes that can be found without running the code (syntax errors, a missing Strategy class
+    or method, undefined names, pandas methods on data arrays) are reported before any sandbox is
+    used.
+
+    With STRATEGY_VALIDATION_LOCAL=true the code is instead checked in a reused local worker
+    process, which is much faster but not isolated; only use this on trusted, self-hosted setups.
+
     Args:
         code_string: The Python code to test
 
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # Static checks first, so common mistakes are found without starting a sandbox
     try:
-        from llm_sandbox import SandboxSession
+        tree = ast.parse(code_string)
+        # Compiling also catches errors the parser accepts, such as 'return' outside a function
+        compile(tree, "<strategy>", "exec")
+    except SyntaxError as e:
+        return False, f"SyntaxError: {e.msg} (line {e.lineno})"
+    strategy_name = _find_strategy_class(tree)
+    if strategy_name is None:
+        return False, "ValueError: No Strategy class found"
+    static_error = _static_validate(tree, strategy_name)
+    if static_error is not None:
+        return False, static_error
+
+    if _LOCAL_VALIDATION:
+        return _execute_locally(code_string)
 
+    try:
         # Validation test code
         test_code = f"""
 {code_string}
 
 # Validation checks
-import inspect
+from backtesting import Strategy as _BaseStrategy
 
-# Find Strategy class
-strategy_class = None
-for name, obj in list(globals().items()):
-    if inspect.isclass(obj) and name != 'Strategy':
-        try:
-            if issubclass(obj, Strategy) and obj is not Strategy:
-                strategy_class = obj
-                break
-        except:
-            pass
+strategy_class = {strategy_name}
 
-if not strategy_class:
-    raise ValueError("No Strategy class found")
+if not issubclass(strategy_class, _BaseStrategy):
+    raise ValueError("{strategy_name} is not a Strategy subclass")
 
 if not hasattr(strategy_class, 'init'):
     raise ValueError("Strategy missing init() method")
@@ -566,20 +984,7 @@ print("VALIDATION_SUCCESS")
 """
 
         # Run in secure sandbox
-        with SandboxSession(lang="python", verbose=False) as session:
-            result = session.run(test_code, libraries=["backtesting", "pandas", "numpy"])
-
-            if result.stderr:
-                # Extract error message
-                error_lines = result.stderr.strip().split("\n")
-                for line in reversed(error_lines):
-                    if "Error:" in line or "NameError" in line or "AttributeError" in line:
-                        return False, line.strip()
-                return False, result.stderr.split("\n")[-1].strip()
-
-            if "VALIDATION_SUCCESS" in result.stdout:
-                return True, "Valid (Docker sandbox)"
-            return False, "Validation failed"
+        result = _run_in_sandbox(test_code)
 
     except ImportError:
         import logging
@@ -601,12 +1006,27 @@ print("VALIDATION_SUCCESS")
             return False, "Server configuration error - Docker not available"
         return False, f"Validation error: {e}"
 
-
-def fix_code_with_llm(llm, code: str, error: str, attempt: int) -> str:
-    """Use LLM to fix code based on error message."""
-    from langchain_core.prompts import ChatPromptTemplate
-
-    fix_prompt = f"""Fix this backtesting.py strategy code. It has an error.
+    else:
+        if result.stderr:
+            # Extract error message
+            error_lines = result.stderr.strip().split("\n")
+            for line in reversed(error_lines):
+                if "Error:" in line or "NameError" in line or "AttributeError" in line:
+                    return False, line.strip()
+            return False, result.stderr.split("\n")[-1].strip()
+
+        if "VALIDATION_SUCCESS" in result.stdout:
+            return True, "Valid (Docker sandbox)"
+        return False, "Validation failed"
+
+
+# Prompt for fixing code that failed validation. Code and error are template variables, so braces
+# in them (dict literals, f-strings) are passed through instead of being parsed as placeholders.
+_FIX_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+            "human",
+            """Fix this backtesting.py strategy code. It has an error.
 
 ORIGINAL CODE:
 ```python
@@ -621,13 +1041,47 @@ RULES:
 - Always include: from backtesting.test import SMA, EMA, RSI (import what you use)
 - Use self.I() for indicators
 - Use array indexing self.data.Close[-1], NOT pandas methods
-- Output ONLY the fixed Python code, no explanations
+{output_rule}
+
+FIXED CODE:""",
+        )
+    ]
+)
+
+
+def _split_variants(response: str) -> list[str]:
+    """Split a fix response into its code variants, removing markdown fences from each."""
+    variants = []
+    for part in response.split(_VARIANT_MARKER):
+        # Each variant may have its own fenced block, or one block may wrap all of them
+        match = _FENCED_BLOCK_RE.search(part)
+        code = match.group(1).strip() if match else ""
+        if not code:
+            code = _FENCE_EDGES_RE.sub("", part.strip()).strip()
+        if code and code not in variants:
+            variants.append(code)
+    return variants
 
-FIXED CODE:"""
 
-    prompt = ChatPromptTemplate.from_messages([("human", fix_prompt)])
-    chain = prompt | llm
-    result = chain.invoke({})
+def fix_code_with_llm(llm, code: str, error: str, attempt: int, variants: int = 1) -> list[str]:
+    """
+    Use LLM to fix code based on error message.
+
+    Asking for several variants gets alternative fixes from a single LLM call, so a second
+    candidate can be tried without another roundtrip when the first one still fails.
+
+    Returns:
+        The fixed code variants, best guess first (at least one)
+    """
+    if variants > 1:
+        output_rule = (
+            f"- Output {variants} different fixed versions of the code, most likely to work first, "
+            f"separated by a line containing only {_VARIANT_MARKER}"
+        )
+    else:
+        output_rule = "- Output ONLY the fixed Python code, no explanations"
+
+    result = (_FIX_TEMPLATE | llm).invoke({"code": code, "error": error, "output_rule": output_rule})
 
     if hasattr(result, "content"):
         fixed_code = result.content
@@ -635,44 +1089,34 @@ FIXED CODE:"""
         fixed_code = str(result)
 
     # Clean markdown fences
-    if "```python" in fixed_code:
-        fixed_code = fixed_code.split("```python")[1].split("```")[0]
-    elif "```" in fixed_code:
-        fixed_code = fixed_code.split("```")[1].split("```")[0]
-
-    return fixed_code.strip()
+    return _split_variants(fixed_code) or [fixed_code.strip()]
 
 
 def auto_fix_common_issues(code_string: str) -> str:
     """Auto-fix common import issues without needing LLM."""
-    lines = code_string.split("\n")
     imports_needed = []
 
     # Check for missing crossover import
-    if "crossover(" in code_string and not any("from backtesting.lib import crossover" in line for line in lines):
+    if "crossover(" in code_string and _CROSSOVER_IMPORT_RE.search(code_string) is None:
         imports_needed.append("from backtesting.lib import crossover")
 
     # Check for missing Strategy import
-    if not any("from backtesting import Strategy" in line for line in lines):
+    if _STRATEGY_IMPORT_RE.search(code_string) is None:
         imports_needed.append("from backtesting import Strategy")
 
-    # Check for missing indicator imports
-    indicators_found = []
-    for indicator in ["SMA", "EMA", "RSI", "MACD", "BBANDS"]:
-        if (f"{indicator}(" in code_string or f"self.I({indicator}" in code_string) and indicator not in str(
-            lines[:10]
-        ):
-            indicators_found.append(indicator)
-
-    if indicators_found:
+    # Check for missing indicator imports, with one pass over the code for uses and one for imports.
+    # Only SMA is ever added, so code that never mentions it skips both passes.
+    if "SMA" in code_string:
+        indicators_used = {called or wrapped for wrapped, called in _INDICATOR_USE_RE.findall(code_string)}
         # Only add SMA as it's the only one in backtesting.test
-        if "SMA" in indicators_found and not any(
-            "from backtesting.test import" in line and "SMA" in line for line in lines
-        ):
-            imports_needed.append("from backtesting.test import SMA")
+        if "SMA" in indicators_used:
+            imported = set(_NAME_RE.findall(" ".join(_TEST_IMPORT_RE.findall(code_string))))
+            if "SMA" not in imported:
+                imports_needed.append("from backtesting.test import SMA")
 
-    # Add imports at the top
+    # Add imports at the top; the code is only split into lines when something has to be inserted
     if imports_needed:
+        lines = code_string.split("\n")
         # Insert after any existing imports or at the start
         insert_pos = 0
         for i, line in enumerate(lines):
@@ -711,25 +1155,32 @@ def validate_strategy_code(code_string: str, llm=None) -> tuple[bool, str, str]:
     # First, try simple auto-fixes
     current_code = auto_fix_common_issues(current_code)
 
+    candidates = [current_code]
     for attempt in range(max_attempts):
-        # Try to execute the code
-        is_valid, error = execute_and_validate_code(current_code)
-
-        # Check if sandbox is not available (server configuration issue)
-        if not is_valid and "Server configuration error" in error:
-            # Can't validate securely, but let code through with warning
-            return True, f"Warning: {error} - Code not validated in sandbox", current_code
-
-        if is_valid:
-            msg = "Valid"
-            if current_code != code_string:
-                msg += " (auto-fixed imports)"
-            return True, msg, current_code
+        # Try the candidates in order; the next fix builds on the first one that failed
+        error = None
+        for candidate in candidates:
+            # Try to execute the code
+            is_valid, message = execute_and_validate_code(candidate)
+
+            # Check if sandbox is not available (server configuration issue)
+            if not is_valid and "Server configuration error" in message:
+                # Can't validate securely, but let code through with warning
+                return True, f"Warning: {message} - Code not validated in sandbox", candidate
+
+            if is_valid:
+                msg = "Valid"
+                if candidate != code_string:
+                    msg += " (auto-fixed imports)"
+                return True, msg, candidate
+
+            if error is None:
+                current_code, error = candidate, message
 
         # If we have an LLM and attempts left, try to fix
         if llm and attempt < max_attempts - 1:
             try:
-                current_code = fix_code_with_llm(llm, current_code, error, attempt + 1)
+                candidates = fix_code_with_llm(llm, current_code, error, attempt + 1, variants=_FIX_VARIANTS)
             except Exception:
                 return False, f"Failed to fix: {error}", current_code
         else:
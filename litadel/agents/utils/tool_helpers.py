@@ -0,0 +1,64 @@
+"""Shared helpers for LangChain tool implementations."""
+
+import logging
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langchain_core.tools import StructuredTool
+    from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_ERR_TMPL = "Error retrieving {label}: {err}".format
+
+
+def safe_call(label: str, impl: Callable[..., str], *args, **kwargs) -> str:
+    """
+    Call a data function, returning an error message instead of raising.
+
+    Args:
+        label: What is being retrieved, used in the error message
+        impl: Data function to call
+        *args: Positional arguments for impl
+        **kwargs: Keyword arguments for impl
+
+    Returns:
+        str: The data function's result, or an error message if it raised
+    """
+    try:
+        return impl(*args, **kwargs)
+    except Exception as e:
+        logger.exception("Error retrieving %s", label)
+        return _ERR_TMPL(label=label, err=e)
+
+
+def lazy_tools(namespace: dict[str, Any], specs: Mapping[str, tuple[Callable[..., str], type["BaseModel"] | None]]):
+    """
+    Create a module-level ``__getattr__`` that builds each tool on first access.
+
+    Tools are built with ``StructuredTool.from_function`` using the function's docstring
+    as the description. Passing an explicit args schema skips signature inspection.
+    Built tools are stored in the module namespace, so later lookups are plain attribute hits.
+
+    Args:
+        namespace: The tool module's ``globals()``
+        specs: Tool name -> (function, args schema or None to infer it from the signature)
+
+    Returns:
+        Callable suitable for assignment to the module's ``__getattr__``
+    """
+
+    def module_getattr(name: str) -> "StructuredTool":
+        try:
+            func, args_schema = specs[name]
+        except KeyError:
+            msg = f"module {namespace['__name__']!r} has no attribute {name!r}"
+            raise AttributeError(msg) from None
+        # Imported here so loading a tool module does not pull in langchain_core.tools
+        from langchain_core.tools import StructuredTool  # noqa: PLC0415
+
+        namespace[name] = StructuredTool.from_function(func, name=name, args_schema=args_schema)
+        return namespace[name]
+
+    return module_getattr
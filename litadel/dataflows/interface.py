@@ -1,3 +1,5 @@
+from functools import wraps
+
 # Import from vendor-specific modules
 from .alpha_vantage import (
     get_all_economic_indicators as get_alpha_vantage_economic_indicators,
@@ -228,6 +230,39 @@ def get_vendor(category: str, method: str | None = None) -> str:
     return config.get("data_vendors", {}).get(category, "default")
 
 
+def get_single_vendor_impl(method: str):
+    """Return the implementation of a method that only one vendor provides, or None.
+
+    Whatever vendors are configured, route_to_vendor always ends up calling this
+    implementation, so callers can invoke the returned function directly and skip the
+    routing. Failures are raised the way route_to_vendor raises them: a RuntimeError
+    for an Alpha Vantage rate limit, or for any other error once the only vendor failed.
+    """
+    vendor_impls = VENDOR_METHODS.get(method, {})
+    if len(vendor_impls) != 1:
+        return None
+    ((vendor, impl),) = vendor_impls.items()
+    if isinstance(impl, list):
+        return None
+
+    @wraps(impl)
+    def call_vendor(*args, **kwargs):
+        try:
+            return impl(*args, **kwargs)
+        except AlphaVantageRateLimitError as e:
+            if vendor == "alpha_vantage":
+                msg = f"Alpha Vantage rate limit exceeded and no local cache available: {e}"
+                raise RuntimeError(msg) from e
+            error = e
+        except Exception as e:
+            error = e
+        print(f"FAILED: {impl.__name__} from vendor '{vendor}' failed: {error}")
+        msg = f"All vendor implementations failed for method '{method}'"
+        raise RuntimeError(msg) from error
+
+    return call_vendor
+
+
 def route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
     category = get_category_for_method(method)
@@ -0,0 +1,79 @@
+"""Unit tests for economic indicator tools."""
+
+import pytest
+
+from litadel.agents.utils import economic_indicator_tools
+
+
+@pytest.fixture(autouse=True)
+def clear_indicator_cache():
+    """Start each test without cached indicator reports."""
+    economic_indicator_tools.clear_economic_indicator_cache()
+    yield
+    economic_indicator_tools.clear_economic_indicator_cache()
+
+
+def test_get_economic_indicators_filters_by_current_date(monkeypatch):
+    """Test that indicators are requested only up to the current date."""
+    calls = []
+
+    def fake_get_all_economic_indicators(**kwargs):
+        calls.append(kwargs)
+        return "indicators"
+
+    monkeypatch.setattr(economic_indicator_tools, "get_all_economic_indicators", fake_get_all_economic_indicators)
+
+    result = economic_indicator_tools.get_economic_indicators.invoke({"current_date": "2024-10-24"})
+
+    assert result == "indicators"
+    assert calls == [{"max_date": "2024-10-24"}]
+
+
+def test_get_economic_indicators_reports_errors(monkeypatch):
+    """Test that data retrieval errors are returned as a message."""
+
+    def failing_get_all_economic_indicators(**_kwargs):
+        msg = "rate limited"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(economic_indicator_tools, "get_all_economic_indicators", failing_get_all_economic_indicators)
+
+    result = economic_indicator_tools.get_economic_indicators.invoke({"current_date": "2024-10-24"})
+
+    assert result == "Error retrieving economic indicators: rate limited"
+
+
+def test_get_economic_indicators_caches_by_date(monkeypatch):
+    """Test that repeated lookups for the same date fetch the indicators once."""
+    calls = []
+
+    def fake_get_all_economic_indicators(**kwargs):
+        calls.append(kwargs)
+        return f"indicators as of {kwargs['max_date']}"
+
+    monkeypatch.setattr(economic_indicator_tools, "get_all_economic_indicators", fake_get_all_economic_indicators)
+
+    tool = economic_indicator_tools.get_economic_indicators
+    assert tool.invoke({"current_date": "2024-10-24"}) == "indicators as of 2024-10-24"
+    assert tool.invoke({"current_date": "2024-10-24"}) == "indicators as of 2024-10-24"
+    assert tool.invoke({"current_date": "2024-10-25"}) == "indicators as of 2024-10-25"
+
+    assert calls == [{"max_date": "2024-10-24"}, {"max_date": "2024-10-25"}]
+
+
+def test_get_economic_indicators_does_not_cache_partial_failures(monkeypatch):
+    """Test that a report with an indicator that failed to parse is fetched again."""
+    calls = []
+
+    def flaky_get_all_economic_indicators(**kwargs):
+        calls.append(kwargs)
+        return "Error parsing GDP data: {}" if len(calls) == 1 else "indicators"
+
+    monkeypatch.setattr(economic_indicator_tools, "get_all_economic_indicators", flaky_get_all_economic_indicators)
+
+    tool = economic_indicator_tools.get_economic_indicators
+    assert tool.invoke({"current_date": "2024-10-24"}) == "Error parsing GDP data: {}"
+    assert tool.invoke({"current_date": "2024-10-24"}) == "indicators"
+    assert tool.invoke({"current_date": "2024-10-24"}) == "indicators"
+
+    assert calls == [{"max_date": "2024-10-24"}, {"max_date": "2024-10-24"}]
@@ -0,0 +1,73 @@
+"""Unit tests for the parameter extraction agent's ticker fast path."""
+
+import pytest
+
+from litadel.agents.utils.parameter_extraction_agent import create_parameter_extraction_agent
+
+
+class _LLMCalledError(Exception):
+    """Raised by the test LLM so a test can tell the message went to the model."""
+
+
+def _llm(_prompt):
+    raise _LLMCalledError
+
+
+def _form_state(**fields):
+    """Form state as the chat interface sends it (see FormData in ChatTradingInterface.tsx)."""
+    form = {
+        "strategy_type": None,
+        "strategy_description": "",
+        "capital": None,
+        "start_date": None,
+        "end_date": None,
+        "ticker_list": [],
+        "asset_preferences": "",
+    }
+    form.update(fields)
+    return form
+
+
+def test_ticker_answer_skips_llm_for_chat_form():
+    """Test that a bare ticker list typed into the chat form is extracted without the LLM."""
+    agent = create_parameter_extraction_agent(_llm, use_cache=False)
+    form = _form_state(
+        strategy_type="technical_strategy",
+        strategy_description="Buy when RSI < 30, sell when RSI > 70",
+        capital=10000,
+    )
+
+    result = agent("AAPL, MSFT", current_form_state=form)
+
+    assert result["intent"] == "backtest"
+    assert result["extracted"] == {"ticker_list": ["AAPL", "MSFT"]}
+    assert result["missing"] == ["start_date", "end_date"]
+    assert result["needs_clarification"] is True
+
+
+def test_ticker_answer_asks_for_missing_description_first():
+    """Test that the fast path asks the flow's own description question when it is missing."""
+    agent = create_parameter_extraction_agent(_llm, use_cache=False)
+    form = _form_state(strategy_type="agent_managed", capital=10000, start_date="2024-01-01", end_date="2024-06-30")
+
+    result = agent("NVDA", current_form_state=form)
+
+    assert result["missing"] == ["strategy_description"]
+    assert result["clarification_questions"][0]["field"] == "strategy_description"
+
+
+@pytest.mark.parametrize(
+    ("message", "form"),
+    [
+        ("AAPL", _form_state()),
+        ("ALL", _form_state(strategy_type="agent_managed")),
+        ("DONT CARE", _form_state(strategy_type="agent_managed")),
+        ("AAPL", _form_state(strategy_type="agent_managed", intent="analysis")),
+    ],
+)
+def test_other_messages_go_to_llm(message, form):
+    """Test that answers that are not tickers, or forms without a known flow, use the LLM."""
+    agent = create_parameter_extraction_agent(_llm, use_cache=False)
+
+    with pytest.raises(_LLMCalledError):
+        agent(message, current_form_state=form)
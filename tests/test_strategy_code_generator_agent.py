@@ -0,0 +1,65 @@
+"""Unit tests for the strategy code generator's static checks."""
+
+import ast
+
+from litadel.agents.utils.strategy_code_generator_agent import _static_validate
+
+_STRATEGY_TEMPLATE = """
+from backtesting import Strategy
+
+
+class MyStrategy(Strategy):
+    def init(self):
+        self.values = {expression}
+
+    def next(self):
+        pass
+"""
+
+
+def _validate(expression: str) -> str | None:
+    return _static_validate(ast.parse(_STRATEGY_TEMPLATE.format(expression=expression)), "MyStrategy")
+
+
+def test_static_validate_rejects_pandas_methods_on_data_arrays():
+    """Test that pandas-only methods on data columns are reported without running the code."""
+    error = _validate("self.data.Close.diff()")
+
+    assert error is not None
+    assert error.startswith("AttributeError: '_Array' object has no attribute 'diff'")
+
+
+def test_static_validate_allows_pandas_methods_on_pandas_data():
+    """Test that the pandas objects exposed by self.data (df, index, .s) are not flagged."""
+    assert _validate("self.data.df.rolling(5).mean()") is None
+    assert _validate("self.data.index.shift(1)") is None
+    assert _validate("self.data.Close.s.pct_change()") is None
+
+
+def test_static_validate_reports_missing_strategy_methods():
+    """Test that a strategy without next() is rejected before it is run."""
+    code = """
+from backtesting import Strategy
+
+
+class MyStrategy(Strategy):
+    def init(self):
+        pass
+"""
+
+    assert _static_validate(ast.parse(code), "MyStrategy") == "ValueError: Strategy missing next() method"
+
+
+def test_static_validate_reports_undefined_names():
+    """Test that calling a name the code never imports or defines is reported as a NameError."""
+    error = _validate("SMA(self.data.Close, 10)")
+
+    assert error is not None
+    assert error.startswith("NameError: name 'SMA' is not defined")
+
+
+def test_static_validate_skips_name_check_after_star_import():
+    """Test that names are not checked when a star import could have bound them."""
+    code = "from backtesting.test import *\n" + _STRATEGY_TEMPLATE.format(expression="SMA(self.data.Close, 10)")
+
+    assert _static_validate(ast.parse(code), "MyStrategy") is None